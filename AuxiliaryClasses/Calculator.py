@@ -63,6 +63,9 @@ class Calculator(QObject):
         self._fit_variables = {'model': self._model_circuit.name}
         self._calculator_variables = {}
 
+        # The caller's dict of current slider values, read by the fit slots
+        self._live_sliders = None
+
     # Public Methods (Interface Unchanged)
     def initialize_expdata(self, file_data: dict) -> None:
         """Set the experimental data from an external dictionary."""
@@ -148,6 +151,21 @@ class Calculator(QObject):
         prior_weight = 400
         return self.fit_builder.fit_model_bode(initial_params, prior_weight)
 
+    def set_live_sliders(self, sliders: dict) -> None:
+        """
+        Set the dict of current slider values that fit_live_cole and
+        fit_live_bode start from. It is kept by reference, not copied.
+        """
+        self._live_sliders = sliders
+
+    def fit_live_cole(self) -> dict:
+        """Fit the Cole model from the live slider values. Usable as a slot."""
+        return self.fit_model_cole(self._live_sliders)
+
+    def fit_live_bode(self) -> dict:
+        """Fit the Bode model from the live slider values. Usable as a slot."""
+        return self.fit_model_bode(self._live_sliders)
+
     def run_model_manual(self, params: dict) -> CalculationResult:
         """
         Run the model with the given parameters.
@@ -40,6 +40,7 @@ class ConfigImporter:
         self.general_font: Optional[int] = None
         self.small_font: Optional[int] = None
         self.print_mode_boolean = False
+        self.use_opengl = False
 
         # Read and process the configuration file.
         self._read_config_file()
@@ -166,6 +167,15 @@ class ConfigImporter:
                 self.print_mode_boolean = False
             else:
                 print(f"Invalid boolean value for print_mode: {print_mode_boolean}")
+
+        if 'GraphRendering' in self.config:
+            use_opengl = self.config['GraphRendering'].get('use_opengl')
+            use_opengl = str(use_opengl.value if hasattr(use_opengl, "value") else use_opengl).strip().lower()
+
+            if use_opengl == "true":
+                self.use_opengl = True
+            elif use_opengl != "false":
+                print(f"Invalid boolean value for use_opengl: {use_opengl}")
                 
     @staticmethod
     def _safe_import(class_name: str):
@@ -7,7 +7,6 @@ Created on Wed Mar  5 12:36:22 2025
 import numpy as np
 import scipy.signal as sig
 from scipy.interpolate import interp1d
-from scipy.interpolate import PchipInterpolator
 from PyQt5.QtCore import QCoreApplication, QObject, pyqtSignal
 from .ModelCircuits import ModelCircuitParent, ModelCircuitParallel, ModelCircuitSeries
 
@@ -27,6 +26,20 @@ class TimeDomainBuilder(QObject):
         self.T = 4           # Time range for Fourier Transform 
         self.model_circuit = model_circuit  
         self._integral_variables = {}
+        self._lowpass = self._lowpass_response(self.N // 2 + 1)
+
+        # The time axis only depends on N and T, so the sample indices
+        # looked up on it are fixed as well.
+        self._t_full = np.arange(self.N, dtype=np.float64) * (self.T / self.N)
+        t = self._t_full
+        time_to_plot_in_seconds = 2
+        self._cutoff_index = int(np.searchsorted(t, time_to_plot_in_seconds, side="right"))
+        self._half_range_index = int(np.searchsorted(t, self.T // 2))
+        keys=['V(.1ms)',	'V(1ms)', 'V(10)',	'V(100)','V(200)',	'V(400)',	'V(800)',	'V(1.2s)', 'V(1.6s)']
+        seconds=[0.0001,	0.001, 0.01,	0.1, 0.2, 0.4, 0.8, 1.2, 1.6]
+        self._integral_indices = tuple(
+            (key, int(np.searchsorted(t, mili))) for key, mili in zip(keys, seconds)
+        )
         
     #-------------------------------------------    
     #   Public Methods
@@ -43,7 +56,6 @@ class TimeDomainBuilder(QObject):
         """ 
         n_freq = (self.N // 2) #+1
         
-        dt = self.T / self.N
         df = 1.0 / self.T
 
         fmin   = 0
@@ -53,19 +65,14 @@ class TimeDomainBuilder(QObject):
 
         z_complex = model_circuit.run_rock(params, freq_even)
         z_complex[0] = z_complex[0].real
+        z_complex *= self._lowpass
         
-        t, volt_down, volt_up=self._fourier_transform_pulse(z_complex, dt)
+        volt_down, volt_up=self._fourier_transform_pulse(z_complex, self._cutoff_index)
         
-        ################ experimental portion.  Check IFFT
-        # freq_even_stepresponse=freq_even*2j*np.pi
-        # z_complex_stepresponse = z_complex / freq_even_stepresponse
-        # t, volt_down, volt_up=self._fourier_transform_response(z_complex_stepresponse, dt) 
-        ########################
+        self._integration_variables(volt_down)
         
-        self._integration_variables(t, volt_down)
-        
-        index = np.searchsorted(t, self.T//2)
-        return freq_even[:index+1], t[:index+1], volt_down[:index+1], volt_up[:index+1]
+        index = self._half_range_index
+        return freq_even[:index+1], self._t_full[:index+1], volt_down[:index+1], volt_up[:index+1]
 
     #This method is not used since it was not fully satisfactory. However it was preserved jsut in case
     def transform_to_time_domain(self,experiment_data):
@@ -89,10 +96,14 @@ class TimeDomainBuilder(QObject):
         freq_even = freq_even[::prune]
               
         z_interp = self._interpolate_points_for_time_domain(freq_even, experiment_data)
+        z_interp *= self._lowpass_response(len(z_interp))
         
         
         #returns the 
-        t, volt_down, volt_up=self._fourier_transform_pulse(z_interp, dt)   
+        t = np.arange(2 * (len(z_interp) - 1)) * dt
+        time_to_plot_in_seconds=2
+        cutoff_index = np.searchsorted(t, time_to_plot_in_seconds, side="right")
+        volt_down, volt_up=self._fourier_transform_pulse(z_interp, cutoff_index)   
         
         index = np.searchsorted(t, self.T//2)
         return freq_even[:index+1], t[:index+1], volt_down[:index+1] 
@@ -113,90 +124,40 @@ class TimeDomainBuilder(QObject):
         interp_real = interp1d(freq, z_real, kind="linear", fill_value="extrapolate")
         interp_imag = interp1d(freq, z_imag, kind="linear", fill_value="extrapolate")
     
-#        interp_real = PchipInterpolator(freq, z_real, extrapolate=True)
-#        interp_imag = PchipInterpolator(freq, z_imag, extrapolate=True)
-    
         # Evaluate the interpolants at the uniformly spaced frequencies.
         z_real_interp = interp_real(freqs_even)
         z_imag_interp = interp_imag(freqs_even)
 
         return z_real_interp + 1j * z_imag_interp
+
+    def _lowpass_response(self, n_bins: int) -> np.ndarray:
         """
-       
-        freq   = np.array(experiment_data["freq"])
-        z_real = np.array(experiment_data["Z_real"])
-        z_imag = np.array(experiment_data["Z_imag"])
-    
-        # 1) Remove any freq <= 0
-        valid_mask = freq > 0
-        freq   = freq[valid_mask]
-        z_real = z_real[valid_mask]
-        z_imag = z_imag[valid_mask]
-    
-        # 2) Sort by ascending freq
-        sort_idx = np.argsort(freq)
-        freq   = freq[sort_idx]
-        z_real = z_real[sort_idx]
-        z_imag = z_imag[sort_idx]
-    
-        # 3) Remove duplicates (if you have any)
-        unique_mask = np.diff(freq, prepend=-np.inf) != 0
-        freq   = freq[unique_mask]
-        z_real = z_real[unique_mask]
-        z_imag = z_imag[unique_mask]
-    
-        # 4) Create log space for your data
-        log_freq_data = np.log10(freq)
-        log_freq_even = np.log10(freqs_even)
-    
-        # 5) Build PCHIP interpolators
-        pchip_real = PchipInterpolator(log_freq_data, z_real, extrapolate=True)
-        pchip_imag = PchipInterpolator(log_freq_data, z_imag, extrapolate=True)
-    
-        z_real_interp = pchip_real(log_freq_even)
-        z_imag_interp = pchip_imag(log_freq_even)
-    
-        return z_real_interp + 1j * z_imag_interp
-          """      
-        
-    def _fourier_transform_response(self, z_complex_stepresponse: np.ndarray, dt: float):
-        """
-        Build the single-sided array for IRFFT and perform a real IFFT.
+        Squared magnitude of the Butterworth low-pass at the n_bins frequencies
+        of a real FFT. Multiplying the spectrum by it is the zero-phase
+        (filtfilt) filter, applied before the IRFFT instead of after it.
         """
-        #b, a = sig.butter(2, 0.45) 
-        z_inversefft = np.fft.irfft(z_complex_stepresponse)       #to transform the impedance data from the freq domain to the time domain.
-                   #largest value is 0.28       
-        #z_inversefft = sig.filtfilt(b, a, z_inversefft)   #Applies filter
-        t = np.arange(len(z_inversefft)) * dt  # constructs time based on N and dt
-        
-        return t, z_inversefft, z_inversefft
-            
-    def _fourier_transform_pulse(self, z_complex: np.ndarray, dt: float):
+        b, a = sig.butter(2, 0.45)
+        _, h = sig.freqz(b, a, worN=np.linspace(0, np.pi, n_bins))
+        return np.abs(h) ** 2
+
+    def _fourier_transform_pulse(self, z_complex: np.ndarray, cutoff_index: int):
         """
         Build the single-sided array for IRFFT and perform a real IFFT.
+        The spectrum is expected to be low-pass filtered already, and
+        cutoff_index is the first sample after the 2 s pulse. The time axis
+        is left to the caller.
         """       
-        b, a = sig.butter(2, 0.45) 
         z_inversefft = np.fft.irfft(z_complex)       #to transform the impedance data from the freq domain to the time domain.
                    #largest value is 0.28       
-        z_inversefft = sig.filtfilt(b, a, z_inversefft)   #Applies filter
-        t = np.arange(len(z_inversefft)) * dt  # constructs time based on N and dt
- 
         volt_up = np.concatenate(([0], np.cumsum(z_inversefft)[:-1]))
         
-        time_to_plot_in_seconds=2
-        
-        index = np.searchsorted(t, time_to_plot_in_seconds, side="right")
-        volt_down = volt_up[index]-volt_up
+        volt_down = volt_up[cutoff_index]-volt_up
         
-        return t, volt_down, volt_up
+        return volt_down, volt_up
 
-    def _integration_variables(self, t, v_down):
-        
-        keys=['V(.1ms)',	'V(1ms)', 'V(10)',	'V(100)','V(200)',	'V(400)',	'V(800)',	'V(1.2s)', 'V(1.6s)']
-        seconds=[0.0001,	0.001, 0.01,	0.1, 0.2, 0.4, 0.8, 1.2, 1.6]
+    def _integration_variables(self, v_down):
         
-        for key, mili in zip (keys, seconds):
-            index = np.searchsorted(t, mili)
+        for key, index in self._integral_indices:
             self._integral_variables[key]=v_down[index]
             
 #------------------------------------------------------------------------------
@@ -221,9 +182,12 @@ class DummyModelCircuit:
         R = params.get("R", 50)  # default 50 ohms
         X = params.get("X", 10)  # default 10 ohms
         # Let's pretend the imaginary part has a sqrt(f) shape, just for variety
-        z_real = np.full_like(freq_even, R, dtype=float)
-        z_imag = X * np.sqrt(freq_even)
-        return z_real + 1j * z_imag
+        # Fill a single complex array in place instead of building and adding parts
+        z = np.empty(freq_even.shape, dtype=np.complex128)
+        z.real = R
+        np.sqrt(freq_even, out=z.imag)
+        z.imag *= X
+        return z
 
 
 # -------------------------------------------------------------------
@@ -1,5 +1,6 @@
 import sys
 import weakref
+from functools import partial
 from typing import Optional
 from PyQt5.QtWidgets import (
     QWidget, QPushButton, QVBoxLayout, QMessageBox, QGraphicsColorizeEffect
@@ -8,6 +9,14 @@ from PyQt5.QtCore import QTimer
 from PyQt5.QtGui import QColor, QFont, QFontMetrics
 
 
+def _clear_effect(button_ref: "weakref.ref[QPushButton]") -> None:
+    """
+    Remove the graphics effect of a button, if the button still exists.
+    """
+    button = button_ref()
+    if button is not None:
+        button.setGraphicsEffect(None)
+
 class DualLabelButton(QPushButton):
     """
     A QPushButton subclass that provides two distinct labels for its off and on states.
@@ -75,15 +84,24 @@ class WidgetButtonsRow(QWidget):
         metrics = QFontMetrics(font)
         button_height = metrics.height()  + 15
 
+        # One stylesheet on the parent, inherited by every button, so Qt
+        # parses and polishes it once instead of once per button. The child
+        # selector keeps it off the buttons of dialogs parented to the row.
+        self.setFont(font)
+        self.setObjectName("WidgetButtonsRow")
+        self.setStyleSheet(
+            f"#WidgetButtonsRow > QPushButton {{ font-size: {self.font}pt;"
+            " margin: 0; padding: 8px; text-align: left; }"
+            )
+
         for button in self._buttons_list:
-            # build and cache the DPI‑aware base style
-            button.setFont(font)
-            base_style = (
-                f"font-size: {self.font}pt;"
-                " margin: 0; padding: 8px; text-align: left;"
+            if isinstance(button, DualLabelButton):
+                # (off, on) pairs, indexed by the toggled state
+                button._labels = (button.off_label, button.on_label)
+                button._styles = (
+                    "background-color: none;",
+                    "background-color: orange;",
                 )
-            button.setStyleSheet(base_style)
-            button._base_style = base_style
             button.setFixedHeight(button_height)
             layout.addWidget(button)
 
@@ -129,17 +147,11 @@ class WidgetButtonsRow(QWidget):
         Handle toggling of checkable buttons: update text and style
         """
         button = self.sender()
-        if not isinstance(button, QPushButton):
+        if not isinstance(button, DualLabelButton):
             return
 
-        if state:
-            button.setText(button.on_label)  # type: ignore[attr-defined]
-            new_style = f"{button._base_style} background-color: orange;"
-        else:
-            button.setText(button.off_label)  # type: ignore[attr-defined]
-            new_style = f"{button._base_style} background-color: none;"
-
-        button.setStyleSheet(new_style)
+        button.setText(button._labels[state])  # type: ignore[attr-defined]
+        button.setStyleSheet(button._styles[state])  # type: ignore[attr-defined]
 
     def _flash_button_green(self, button: QPushButton, duration: int = 1500) -> None:
         """
@@ -150,10 +162,7 @@ class WidgetButtonsRow(QWidget):
         effect.setStrength(1.0)
         button.setGraphicsEffect(effect)
 
-        weak_button = weakref.ref(button)
-        QTimer.singleShot(
-            duration, lambda: weak_button() and weak_button().setGraphicsEffect(None)
-        )
+        QTimer.singleShot(duration, partial(_clear_effect, weakref.ref(button)))
 
 if __name__ == "__main__":
     from PyQt5.QtWidgets import QApplication
@@ -10,18 +10,114 @@ Graphs for impedance data visualization:
   - WidgetGraphs (displays multiple graphs)
 """
 import sys
-import copy
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cached_property
+
 import numpy as np
 import pyqtgraph as pg
-from pyqtgraph import FillBetweenItem, InfiniteLine, mkPen
+from pyqtgraph import FillBetweenItem, InfiniteLine
 
 from PyQt5.QtWidgets import (
     QApplication, QPushButton, QWidget, QTabWidget, QHBoxLayout, QTabWidget,
-    QVBoxLayout, QFrame, QSizePolicy, QSplitter, QToolTip, QLineEdit
+    QVBoxLayout, QFrame, QSizePolicy, QSplitter, QToolTip, QLineEdit,
+    QGraphicsItem
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QSignalBlocker
 from PyQt5.QtGui import QFont
 
+def _enable_opengl():
+    """
+    Gives the plots OpenGL viewports if PyOpenGL is installed. Must run before
+    any PlotWidget is created. Returns True if OpenGL was enabled.
+    """
+    # Only the viewport changes: items are still drawn by QPainter (through
+    # Qt's OpenGL paint engine), so dashed pens and cached items render as
+    # usual. pyqtgraph's experimental paintGL path is left off.
+    try:
+        import OpenGL  # noqa: F401
+    except ImportError:
+        print("use_opengl is set but PyOpenGL is not installed")
+        return False
+    pg.setConfigOptions(useOpenGL=True)
+    return True
+
+# The Phase and Bode transforms run on every refresh, and the time graph
+# chargeabilities on every manual update. With Numba installed each one is
+# fused into a single compiled loop, otherwise it runs as plain NumPy
+# expressions. The transforms write into the given output arrays.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _phase_xy(freq, z_real, z_imag, freq_log, phase_log):
+        for i in range(freq.shape[0]):
+            freq_log[i] = np.log10(freq[i])
+            phase_deg = np.degrees(np.arctan2(z_imag[i], z_real[i]))
+            phase_log[i] = np.log10(max(abs(phase_deg), 1e-10))  # Avoid log of zero
+
+    @njit(cache=True)
+    def _bode_xy(freq, z_real, z_imag, freq_log, mag_db):
+        for i in range(freq.shape[0]):
+            freq_log[i] = np.log10(freq[i])
+            mag_db[i] = np.log10(np.sqrt(z_real[i]**2 + z_imag[i]**2))
+
+    @njit(cache=True)
+    def _chargeabilities(t, v):
+        mx_sum = 0.0
+        mt_sum = 0.0
+        for i in range(t.shape[0] - 1):
+            # Trapezoids with both ends inside each window
+            if t[i] >= 0.0 and t[i + 1] <= 2.0:
+                area = 0.5 * (t[i + 1] - t[i]) * (v[i + 1] + v[i])
+                mt_sum += area
+                if t[i] >= 0.45 and t[i + 1] <= 1.1:
+                    mx_sum += area
+        return mx_sum, mt_sum
+
+    # Compile at import instead of stalling the first plot refresh, for both
+    # the float32 and float64 graphs
+    for _dtype in (np.float32, np.float64):
+        _warm_up = np.ones(1, dtype=_dtype)
+        _phase_xy(_warm_up, _warm_up, _warm_up, np.empty_like(_warm_up), np.empty_like(_warm_up))
+        _bode_xy(_warm_up, _warm_up, _warm_up, np.empty_like(_warm_up), np.empty_like(_warm_up))
+    _chargeabilities(np.arange(2.0), np.ones(2))
+else:
+    def _phase_xy(freq, z_real, z_imag, freq_log, phase_log):
+        np.log10(freq, out=freq_log)
+        np.arctan2(z_imag, z_real, out=phase_log)
+        np.degrees(phase_log, out=phase_log)
+        np.abs(phase_log, out=phase_log)
+        np.maximum(phase_log, 1e-10, out=phase_log)  # Avoid log of zero
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.log10(phase_log, out=phase_log)
+
+    def _bode_xy(freq, z_real, z_imag, freq_log, mag_db):
+        np.log10(freq, out=freq_log)
+        np.hypot(z_real, z_imag, out=mag_db)
+        np.log10(mag_db, out=mag_db)  # or 20*np.log10(mag) if you really want dB
+
+    def _chargeabilities(t, v):
+        # Cumulative trapezoid integral, so any window is two lookups.
+        # cum[k] is the integral from sample 0 to sample k
+        seg = np.diff(t)
+        seg *= v[1:] + v[:-1]
+        seg *= 0.5
+        cum = np.empty(t.size)
+        cum[:1] = 0.0
+        np.cumsum(seg, out=cum[1:])
+
+        # Windows found by binary search since t is sorted. Window
+        # [tmin, tmax] holds samples i0..i1-1
+        i_mx0, i_mt0 = np.searchsorted(t, (0.45, 0.0), side='left')
+        i_mx1, i_mt1 = np.searchsorted(t, (1.1, 2.0), side='right')
+        mx_sum = cum[max(i_mx1 - 1, i_mx0)] - cum[i_mx0] if i_mx0 < t.size else 0.0
+        mt_sum = cum[max(i_mt1 - 1, i_mt0)] - cum[i_mt0] if i_mt0 < t.size else 0.0
+        return mx_sum, mt_sum
+
 # Example import for the type-hinted method below:
 # from ModelManual import CalculationResult
 # In your real code, ensure CalculationResult is defined or properly imported.
@@ -32,17 +128,43 @@ class CalculationResult:
         self.main_z_real = np.array([100, 80, 60])
         self.main_z_imag = np.array([-50, -40, -30])
             
-        self.rock_z_real = np.ndarray([100, 80, 60])
-        self.rock_z_imag = np.ndarray([-48, -32, -28])
+        self.rock_z_real = np.array([100, 80, 60])
+        self.rock_z_imag = np.array([-48, -32, -28])
 
         self.special_freq = np.array([10, 50, 90])
         self.special_z_real = np.array([70, 65, 55])
         self.special_z_imag = np.array([-40, -35, -28])
 
         self.timedomain_freq = np.array([0.01, 4.5, 1.1])
-        self.timedomain_time = np.linspace(0, 1, 100)
-        self.timedomain_volt_down = np.sin(2 * np.pi * 10 * self.timedomain_time)
-        self.timedomain_volt_up = np.cos(2 * np.pi * 10 * self.timedomain_time)
+
+    # The waveforms are only built if something actually reads them
+    @cached_property
+    def timedomain_time(self):
+        return np.linspace(0, 1, 100)
+
+    @cached_property
+    def timedomain_volt_down(self):
+        return np.sin(2 * np.pi * 10 * self.timedomain_time)
+
+    @cached_property
+    def timedomain_volt_up(self):
+        return np.cos(2 * np.pi * 10 * self.timedomain_time)
+
+
+def _minmax(arr):
+    """(min, max) of arr, or (inf, -inf) if it is empty."""
+    return (arr.min(), arr.max()) if arr.size else (np.inf, -np.inf)
+
+
+@dataclass(slots=True)
+class ImpedanceSeries:
+    """
+    One dataset of a graph: the frequencies and the matching impedance.
+    TimeGraph stores time and voltage in z_real and z_imag.
+    """
+    freq: np.ndarray
+    z_real: np.ndarray
+    z_imag: np.ndarray
 
 
 class ParentGraph(pg.PlotWidget):
@@ -50,15 +172,27 @@ class ParentGraph(pg.PlotWidget):
     A base PlotWidget that manages 'base' data, 'manual' data, and special markers.
     Subclasses may override _prepare_xy(...) and certain UI aspects.
     """
+    # Precision of the stored datasets. float32 is plenty for a plot and
+    # halves the memory every transform has to walk through.
+    DATA_DTYPE = np.float32
+
+    # Pens and brushes of the special markers, shared by all graphs
+    _PEN_CACHE = {}
+    _BRUSH_CACHE = {}
+
     def __init__(self, print_mode: bool = False):
         
         super().__init__()
         self.setMouseTracking(True)
         
+        self._xy_cache = {}
+        self._bounds_cache = {}
+        self._xy_buffer_cache = {}
+        self._freq_order_cache = {}
         self._init_data()
         self._init_ui()
         self._init_signals()
-        self._special_items = []
+        self._special_lines = {}
         self.fill_region = None
         self._dynamic_plot = None
         self._static_plot = None
@@ -76,7 +210,10 @@ class ParentGraph(pg.PlotWidget):
         # Display of coordenates as the mouse hoovers over the plot
         self._coord_label = pg.TextItem("", anchor=(0, 1), color="w")
         self.plotItem.vb.addItem(self._coord_label)
-        self.scene().sigMouseMoved.connect(self._mouse_moved)
+        # Coalesce mouse moves to at most 60 per second
+        self._mouse_proxy = pg.SignalProxy(
+            self.scene().sigMouseMoved, rateLimit=60, slot=self._mouse_moved_proxy
+        )
 
     # -----------------------------------------------------------------------
     #  Public Methods
@@ -89,25 +226,8 @@ class ParentGraph(pg.PlotWidget):
         """
         Filters base and manual data to only show points in [f_min, f_max].
         """
-        base_mask = (
-            (self._original_base_data['freq'] >= f_min) &
-            (self._original_base_data['freq'] <= f_max)
-        )
-        self._base_data = {
-            'freq': self._original_base_data['freq'][base_mask],
-            'Z_real': self._original_base_data['Z_real'][base_mask],
-            'Z_imag': self._original_base_data['Z_imag'][base_mask],
-        }
-
-        manual_mask = (
-            (self._original_manual_data['freq'] >= f_min) &
-            (self._original_manual_data['freq'] <= f_max)
-        )
-        self._manual_data = {
-            'freq': self._original_manual_data['freq'][manual_mask],
-            'Z_real': self._original_manual_data['Z_real'][manual_mask],
-            'Z_imag': self._original_manual_data['Z_imag'][manual_mask],
-        }
+        self._base_data = self._filter_original('base', f_min, f_max)
+        self._manual_data = self._filter_original('manual', f_min, f_max)
 
         self._refresh_graph()
 
@@ -116,98 +236,140 @@ class ParentGraph(pg.PlotWidget):
         Updates the 'base' data and refreshes. The original data is also updated
         so filtering is always relative to the new full dataset.
         """
-        # Temporarily disable auto-scale so it won't interfere
-        self.auto_scale_button.setChecked(False)
-
-        self._base_data = {'freq': freq, 'Z_real': Z_real, 'Z_imag': Z_imag}
-        self._original_base_data = copy.deepcopy(self._base_data)
-
-        # Refresh once
-        self._refresh_graph()
-        # Re-enable auto-scale if desired
+        # Temporarily disable auto-scale so it won't interfere. Unchecking has
+        # no side effect, so the toggled signal is not even dispatched.
+        with QSignalBlocker(self.auto_scale_button):
+            self.auto_scale_button.setChecked(False)
+
+        self._base_data = self._make_series(freq, Z_real, Z_imag)
+        # Filtering builds new arrays and never modifies these, so the
+        # original data can share them instead of holding a copy.
+        self._original_base_data = self._base_data
+
+        # Only the static plot shows the base data
+        self._refresh_plot('base', self._static_plot)
+        # Re-enable auto-scale, which rescales once to the new data
         self.auto_scale_button.setChecked(True)
 
     def update_parameters_manual(self, freq, Z_real, Z_imag):
         """
         Updates the 'manual' (dynamic) data. Only that plot is changed.
         """
-        self._manual_data = {'freq': freq, 'Z_real': Z_real, 'Z_imag': Z_imag}
-        self._original_manual_data = copy.deepcopy(self._manual_data)
-        self._refresh_plot(self._manual_data, self._dynamic_plot)
+        self._manual_data = self._make_series(freq, Z_real, Z_imag)
+        self._original_manual_data = self._manual_data
+        self._refresh_plot('manual', self._dynamic_plot)
 
     def update_special_frequencies(self, freq_array, z_real_array, z_imag_array):
         """
         Adds or updates special marker points on the graph.
         """
-        # 1) Clear out the old items
-        for item in self._special_items:
-            self.removeItem(item)
-        self._special_items = []
-
-        symbols = ['x', 'd', 's']
-        colors  = ['r', 'g', 'b']
-
-        # 2) For each frequency triplet, compute its styling then plot it
-        for i, (freq, zr, zi) in enumerate(zip(freq_array, z_real_array, z_imag_array)):
-            group_index  = i // 3
-            symbol       = symbols[ group_index % len(symbols) ]
-            color        = colors[ i % len(colors) ]
-            filled       = (group_index % 2 == 0)
-
-            plot_item = self._draw_special_marker(
-                freq, zr, zi,
-                symbol=symbol,
-                color=color,
-                filled=filled
-            )
-            self._special_items.append(plot_item)
+        # 1) Clear out the old marker lines (the scatter is fully replaced below)
+        for item in self._special_lines.values():
+            item.setData([], [])
+
+        symbols = np.array(['x', 'd', 's'])
+        colors  = np.array(['r', 'g', 'b'])
+
+        freq_array = np.asarray(freq_array)
+        z_real_array = np.asarray(z_real_array)
+        z_imag_array = np.asarray(z_imag_array)
+
+        # 2) Style of every point, as aligned arrays
+        point_index = np.arange(len(freq_array))
+        group_index = point_index // 3
+        symbol_index = group_index % len(symbols)
+        color_index = point_index % len(colors)
+        filled = (group_index % 2 == 0)
+
+        # 3) Group the points by styling, so each style is drawn in one go,
+        #    then show all spots with one setData call
+        style = (symbol_index * len(colors) + color_index) * 2 + filled
+        spots = []
+        for code in np.unique(style):
+            idx = np.flatnonzero(style == code)
+            first = idx[0]
+            spots.extend(self._draw_special_marker(
+                freq_array[idx], z_real_array[idx], z_imag_array[idx],
+                symbol=str(symbols[symbol_index[first]]),
+                color=str(colors[color_index[first]]),
+                filled=bool(filled[first])
+            ))
+        self._special_scatter.setData(spots=spots)
             
     def _draw_special_marker(self, freq, zr, zi, symbol, color, filled):
         """
-        Handles the coordinate transform + single‐point plotting.
-        By extracting the scalar out of the 1‐element arrays, we
-        avoid any surprises in how PlotDataItem interprets the x,y shapes.
+        Handles the coordinate transform of all the points that share one
+        styling, and returns them as spots for the special markers scatter.
         """
         # transform into plot coordinates
-        x_arr, y_arr = self._prepare_xy(
-            np.array([freq]),
-            np.array([zr]),
-            np.array([zi])
-        )
-        # pull out the scalar floats
-        x = float(x_arr[0])
-        y = float(y_arr[0])
-
-        pen   = pg.mkPen(color, width=2)
-        brush = color if filled else None
-
-        return self.plot(
-            [x], [y],              # pass single‐element lists
-            pen=None,
-            symbol=symbol,
-            symbolSize=12,
-            symbolPen=pen,
-            symbolBrush=brush
-        )
+        x_arr, y_arr = self._prepare_xy(freq, zr, zi)
+
+        pen   = self._marker_pen(color)
+        brush = self._marker_brush(color if filled else None)
+
+        return [
+            {'pos': (x, y), 'symbol': symbol, 'size': 12, 'pen': pen, 'brush': brush}
+            for x, y in zip(x_arr, y_arr)
+        ]
+
+    def _special_line(self, color, filled):
+        """
+        Return the persistent item drawing the vertical marker lines of the
+        given style bucket, creating it the first time.
+        """
+        # Keyed like the bucket, so same-color buckets don't share an item
+        key = (color, filled)
+        item = self._special_lines.get(key)
+        if item is None:
+            item = self._special_lines[key] = self.plot(
+                pen=self._marker_pen(color),
+                connect='pairs',
+                symbol=None
+            )
+        return item
+
+    @classmethod
+    def _marker_pen(cls, color):
+        """Return the shared 2 px pen of the given marker color."""
+        pen = cls._PEN_CACHE.get(color)
+        if pen is None:
+            pen = cls._PEN_CACHE[color] = pg.mkPen(color, width=2)
+        return pen
+
+    @classmethod
+    def _marker_brush(cls, color):
+        """Return the shared brush of the given marker color."""
+        brush = cls._BRUSH_CACHE.get(color)
+        if brush is None:
+            brush = cls._BRUSH_CACHE[color] = pg.mkBrush(color)
+        return brush
+
     # -----------------------------------------------------------------------
     #  Private Methods
     # -----------------------------------------------------------------------
     def _init_data(self):
         """Initialize default datasets and originals for filtering."""
-        self._base_data = {
-            'freq': np.array([1, 10, 100, 1000, 10000]),
-            'Z_real': np.array([100, 80, 60, 40, 20]),
-            'Z_imag': np.array([-50, -40, -30, -20, -10]),
-        }
-        self._manual_data = {
-            'freq': np.array([1, 10, 100, 1000, 10000]),
-            'Z_real': np.array([90, 70, 50, 30, 10]),
-            'Z_imag': np.array([-45, -35, -25, -15, -5]),
-        }
-
-        self._original_base_data = copy.deepcopy(self._base_data)
-        self._original_manual_data = copy.deepcopy(self._manual_data)
-        self._auto_range_in_progress = False
+        self._base_data = self._make_series(
+            [1, 10, 100, 1000, 10000],
+            [100, 80, 60, 40, 20],
+            [-50, -40, -30, -20, -10],
+        )
+        self._manual_data = self._make_series(
+            [1, 10, 100, 1000, 10000],
+            [90, 70, 50, 30, 10],
+            [-45, -35, -25, -15, -5],
+        )
+
+        self._original_base_data = self._base_data
+        self._original_manual_data = self._manual_data
+
+    def _make_series(self, freq, z_real, z_imag):
+        """Store a dataset as an ImpedanceSeries of contiguous DATA_DTYPE arrays."""
+        return ImpedanceSeries(
+            np.ascontiguousarray(freq, dtype=self.DATA_DTYPE),
+            np.ascontiguousarray(z_real, dtype=self.DATA_DTYPE),
+            np.ascontiguousarray(z_imag, dtype=self.DATA_DTYPE),
+        )
 
     def _init_ui(self):
         """Setup the UI: title, grid, auto-scale button, etc."""
@@ -240,6 +402,9 @@ class ParentGraph(pg.PlotWidget):
             symbolSize=6,
             symbolBrush='g', symbolPen='g'
         )
+        # The base data rarely changes, so keep its curve rasterized and just
+        # blit it on repaints. setData() invalidates the cache on its own.
+        self._static_plot.curve.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         # Dynamic plot item (model or manual data)
         self._dynamic_plot = self.plot(
             pen=pg.mkPen(color='c', width=2),
@@ -247,32 +412,123 @@ class ParentGraph(pg.PlotWidget):
             symbolSize=11,
             symbolBrush=None, symbolPen='c'
         )
+        # Special frequency markers, kept on top of the curves
+        self._special_scatter = pg.ScatterPlotItem()
+        self._special_scatter.setZValue(10)
+        self.addItem(self._special_scatter)
 
     def _refresh_graph(self):
         """
         Updates the existing static and dynamic plot items with current data.
         No more clearing or re-adding new plot items each time.
         """
-        self._refresh_plot(self._manual_data, self._dynamic_plot)
-        self._refresh_plot(self._base_data, self._static_plot)
+        self._refresh_plot('manual', self._dynamic_plot)
+        self._refresh_plot('base', self._static_plot)
 
-    def _refresh_plot(self, data_dict, plot_item):
+    def _refresh_plot(self, name, plot_item):
         """
-        Update a single plot item with new data. data_dict must have freq, Z_real, Z_imag.
+        Update a single plot item with the data of the dataset called name
+        ('base', 'manual' or 'secondary').
         """
         if plot_item is None:
             return  # Not yet created
-        x, y = self._prepare_xy(
-            data_dict['freq'],
-            data_dict['Z_real'],
-            data_dict['Z_imag']
-        )
+        x, y = self._get_xy(name)
         plot_item.setData(x, y)
 
-    def _prepare_xy(self, freq, z_real, z_imag):
+    # Attribute holding each dataset, by the name used in the (x, y) cache
+    _DATA_ATTRS = {
+        'base': '_base_data',
+        'manual': '_manual_data',
+        'secondary': '_secondary_manual_data',
+    }
+
+    def _get_xy(self, name):
+        """
+        Return the (x, y) plot coordinates of the dataset called name.
+        They are computed with _prepare_xy once and reused until the dataset
+        is replaced, which every update and filter does.
+        """
+        series = getattr(self, self._DATA_ATTRS[name])
+        cached = self._xy_cache.get(name)
+        if cached is None or cached[0] is not series:
+            xy = self._prepare_xy(
+                series.freq,
+                series.z_real,
+                series.z_imag,
+                out=self._xy_buffers(name, len(series.freq))
+            )
+            cached = self._xy_cache[name] = (series, xy)
+        return cached[1]
+
+    def _xy_bounds(self, name):
+        """
+        Return (x_min, x_max, y_min, y_max) of the dataset called name, with
+        inf/-inf for an empty one. Cached like _get_xy, so autoscaling again
+        on unchanged data skips the reductions.
+        """
+        series = getattr(self, self._DATA_ATTRS[name])
+        cached = self._bounds_cache.get(name)
+        if cached is None or cached[0] is not series:
+            x, y = self._get_xy(name)
+            cached = self._bounds_cache[name] = (series, _minmax(x) + _minmax(y))
+        return cached[1]
+
+    def _prepare_all_xy(self):
+        """
+        Return the (x, y) plot coordinates of every dataset this graph holds:
+        base, manual and, for graphs that have one, secondary.
+        """
+        names = self._DATA_ATTRS if hasattr(self, '_secondary_manual_data') else ('base', 'manual')
+        return [self._get_xy(name) for name in names]
+
+    def _xy_buffers(self, name, n):
+        """
+        Return the persistent (x, y) output arrays of the dataset called name,
+        reallocated only when the number of points changes.
+        """
+        buffers = self._xy_buffer_cache.get(name)
+        if buffers is None or len(buffers[0]) != n:
+            buffers = self._xy_buffer_cache[name] = (
+                np.empty(n, dtype=self.DATA_DTYPE),
+                np.empty(n, dtype=self.DATA_DTYPE),
+            )
+        return buffers
+
+    # Attribute holding the unfiltered version of each dataset
+    _ORIGINAL_DATA_ATTRS = {
+        'base': '_original_base_data',
+        'manual': '_original_manual_data',
+        'secondary': '_original_secondary_manual_data',
+    }
+
+    def _filter_original(self, name, f_min, f_max):
+        """
+        Return the points of the unfiltered dataset called name whose freq is
+        in [f_min, f_max], keeping their original order. The frequencies are
+        sorted once per dataset, so each call only needs two binary searches.
+        """
+        series = getattr(self, self._ORIGINAL_DATA_ATTRS[name])
+        cached = self._freq_order_cache.get(name)
+        if cached is None or cached[0] is not series:
+            order = np.argsort(series.freq, kind='stable')
+            cached = (series, order, series.freq[order])
+            self._freq_order_cache[name] = cached
+        _, order, sorted_freq = cached
+
+        lo = np.searchsorted(sorted_freq, f_min, side='left')
+        hi = np.searchsorted(sorted_freq, f_max, side='right')
+        selection = np.sort(order[lo:hi])
+        return ImpedanceSeries(
+            series.freq[selection],
+            series.z_real[selection],
+            series.z_imag[selection],
+        )
+
+    def _prepare_xy(self, freq, z_real, z_imag, out=None):
         """
         Default transformation: (Z_real, Z_imag) -> (x, y).
-        Subclasses override for Bode, Phase, etc.
+        Subclasses override for Bode, Phase, etc. Transforms that compute
+        new arrays write them into out, an (x, y) pair of arrays, if given.
         """
         return z_real, z_imag
 
@@ -281,29 +537,44 @@ class ParentGraph(pg.PlotWidget):
             self._apply_auto_scale()
 
     def _on_view_range_changed(self, view_box, view_range):
-        if self.auto_scale_button.isChecked() and not self._auto_range_in_progress:
+        if self.auto_scale_button.isChecked():
             self._apply_auto_scale()
 
+    def _set_view_range(self, x_range, y_range, padding):
+        """
+        Set the view range with _on_view_range_changed disconnected, so the
+        auto-scale does not re-enter itself through sigRangeChanged. Only this
+        slot is blocked; the axes and grid still follow the range change.
+        """
+        vb = self.plotItem.getViewBox()
+        with pg.SignalBlock(vb.sigRangeChanged, self._on_view_range_changed):
+            vb.setRange(xRange=x_range, yRange=y_range, padding=padding)
+
+    def _set_edge_ticks(self):
+        """
+        Show integer ticks over the fixed X_RANGE and Y_RANGE, so the edge
+        ticks are visible. The ranges never change, so this is done once.
+        """
+        x_min, x_max = self.X_RANGE
+        y_min, y_max = self.Y_RANGE
+        self.getPlotItem().getAxis('bottom').setTicks([
+            [(i, str(i)) for i in range(int(x_min), int(x_max+1))]
+        ])
+        self.getPlotItem().getAxis('left').setTicks([
+            [(i, str(i)) for i in range(int(y_min), int(y_max+1))]
+        ])
+
     def _apply_auto_scale(self):
         """
         Auto-scales the view based on the static (base) plot data.
         """
-        x_data, y_data = self._prepare_xy(
-            self._base_data['freq'],
-            self._base_data['Z_real'],
-            self._base_data['Z_imag']
-        )
-        if x_data.size and y_data.size:
-            x_min, x_max = np.min(x_data), np.max(x_data)
-            y_min, y_max = np.min(y_data), np.max(y_data)
-
-            self._auto_range_in_progress = True
-            self.plotItem.getViewBox().setRange(
-                xRange=(x_min, x_max),
-                yRange=(y_min, y_max),
-                padding= self._autoscale_padding
-            )
-            self._auto_range_in_progress = False
+        x_min, x_max, y_min, y_max = self._xy_bounds('base')
+        if x_min <= x_max and y_min <= y_max:
+            self._set_view_range((x_min, x_max), (y_min, y_max), self._autoscale_padding)
+
+    def _mouse_moved_proxy(self, event):
+        """SignalProxy slot: the proxied signal arguments come as a tuple."""
+        self._mouse_moved(event[0])
 
     def _mouse_moved(self, pos):
         """
@@ -313,44 +584,18 @@ class ParentGraph(pg.PlotWidget):
         """
         #sets how close the point needs to be to the cursor
         threshold_pixels = 5.0
-            
-        # We'll store (distance_in_pixels, x_in_data, y_in_data).
-        candidates = []
     
-        # Gather points from base data
-        x_base, y_base = self._prepare_xy(
-            self._base_data['freq'],
-            self._base_data['Z_real'],
-            self._base_data['Z_imag'],
-        )
-        candidates.extend(
-            self._build_scene_candidates(pos, x_base, y_base)
-        )
-    
-        # Gather points from manual data
-        x_man, y_man = self._prepare_xy(
-            self._manual_data['freq'],
-            self._manual_data['Z_real'],
-            self._manual_data['Z_imag'],
-        )
-        candidates.extend(
-            self._build_scene_candidates(pos, x_man, y_man)
-        )
-    
-        # If this is ColeColeGraph or if there's secondary data
-        if hasattr(self, '_secondary_manual_data') and self._secondary_manual_data['freq'].size > 0:
-            x_sec, y_sec = self._prepare_xy(
-                self._secondary_manual_data['freq'],
-                self._secondary_manual_data['Z_real'],
-                self._secondary_manual_data['Z_imag'],
-            )
-            candidates.extend(
-                self._build_scene_candidates(pos, x_sec, y_sec)
-            )
+        # Gather points from base, manual and (if any) secondary data
+        sources = self._prepare_all_xy()
+        x_all = np.concatenate([x for x, _ in sources])
+        y_all = np.concatenate([y for _, y in sources])
+
+        # We'll get the closest point as (distance_in_pixels, x_in_data, y_in_data).
+        candidates = self._build_scene_candidates(pos, x_all, y_all)
     
         label_text = ""
         if candidates:
-            best = min(candidates, key=lambda t: t[0])  # t[0] is pixel distance
+            best = candidates[0]
 
             if best[0] < threshold_pixels:
                 # "Snap" to that point
@@ -365,24 +610,27 @@ class ParentGraph(pg.PlotWidget):
     
     def _build_scene_candidates(self, mouse_scene_pos, x_array, y_array):
         """
-        Given arrays of x, y in data space, convert them each to scene
-        coords and measure pixel distance to mouse_scene_pos.
-        Returns a list of (dist_in_pixels, x_data, y_data).
+        Given arrays of x, y in data space, convert them all to scene
+        coords with the view transform and measure pixel distance to
+        mouse_scene_pos.
+        Returns a list with the closest point as (dist_in_pixels, x_data, y_data),
+        or an empty list if there are no points.
         """
+        if len(x_array) == 0:
+            return []
+
+        # Same mapping as vb.mapViewToScene, applied to every point at once
         vb = self.plotItem.vb
-        result = []
-        for (xd, yd) in zip(x_array, y_array):
-            # Convert (xd, yd) from data coords -> scene coords
-            data_point_scene = vb.mapViewToScene(pg.QtCore.QPointF(xd, yd))
-    
-            # Pixel-distance from mouse to that data point
-            dx = data_point_scene.x() - mouse_scene_pos.x()
-            dy = data_point_scene.y() - mouse_scene_pos.y()
-            dist_pixels = (dx*dx + dy*dy)**0.5
-    
-            result.append((dist_pixels, xd, yd))
-    
-        return result
+        vb.updateMatrix()
+        tr = vb.childGroup.sceneTransform()
+        x_array = np.asarray(x_array, dtype=float)
+        y_array = np.asarray(y_array, dtype=float)
+        dx = tr.m11() * x_array + tr.m21() * y_array + tr.dx() - mouse_scene_pos.x()
+        dy = tr.m12() * x_array + tr.m22() * y_array + tr.dy() - mouse_scene_pos.y()
+        dist2 = dx*dx + dy*dy
+
+        i = int(np.argmin(dist2))
+        return [(float(np.sqrt(dist2[i])), x_array[i], y_array[i])]
 
     """
     #this version of mouse moved will display the values of any coordenates 
@@ -420,6 +668,9 @@ class ParentGraph(pg.PlotWidget):
         
 
 class PhaseGraph(ParentGraph):
+    X_RANGE = (-2.2, 6.08)
+    Y_RANGE = (-1.2, 2.4)
+
     def __init__(self, print_mode=False):
         super().__init__(print_mode)
         self._autoscale_padding = 0.0
@@ -427,52 +678,39 @@ class PhaseGraph(ParentGraph):
         self.setLabel('bottom', "log10(Freq[Hz])")
         self.setLabel('left', "log10(|Phase|)")
         self.getViewBox().invertX(True)
-
-    def _prepare_xy(self, freq, z_real, z_imag):
-        freq_log = np.log10(freq)
-        phase_deg = np.degrees(np.arctan2(z_imag, z_real))
-        phase_log = np.log10(np.abs(phase_deg) + 1e-10)  # Avoid log of zero
-        return freq_log, phase_log
+        self._set_edge_ticks()
+
+    def _prepare_xy(self, freq, z_real, z_imag, out=None):
+        freq = np.asarray(freq, dtype=self.DATA_DTYPE)
+        if out is None:
+            out = (np.empty_like(freq), np.empty_like(freq))
+        _phase_xy(
+            freq,
+            np.asarray(z_real, dtype=self.DATA_DTYPE),
+            np.asarray(z_imag, dtype=self.DATA_DTYPE),
+            *out
+        )
+        return out
     
     def _apply_auto_scale(self):
         """
         Auto-scales the view based on the static (base) plot data,
         but clamps the X range to [-2, 6] to ensure edge ticks are visible.
         """
-        # Clamp x-range to fixed hard bounds
-        x_min =-2.2
-        x_max = 6.08
-        y_min =-1.2
-        y_max = 2.4
-    
-        self._auto_range_in_progress = True
-        self.plotItem.getViewBox().setRange(
-        xRange=(x_min, x_max),
-        yRange=(y_min, y_max),
-            padding=self._autoscale_padding
-        )
-        self._auto_range_in_progress = False
-    
-        # Force edge ticks to be shown
-        self.getPlotItem().getAxis('bottom').setTicks([
-            [(i, str(i)) for i in range(int(x_min), int(x_max+1))]
-        ])
-        self.getPlotItem().getAxis('left').setTicks([
-            [(i, str(i)) for i in range(int(y_min), int(y_max+1))]
-        ])
+        # Clamp to the fixed hard bounds
+        x_min, x_max = self.X_RANGE
+        y_min, y_max = self.Y_RANGE
+        self._set_view_range((x_min, x_max), (y_min, y_max), self._autoscale_padding)
       
     def _draw_special_marker(self, freq, zr, zi, symbol, color, filled):
         if symbol == 'x':
-            x_vals, _ = self._prepare_xy(
-                np.array([freq]), np.array([zr]), np.array([zi])
-            )
-            x0 = x_vals[0]
+            # One vertical line per point, drawn by the item of that bucket
+            x_vals, _ = self._prepare_xy(freq, zr, zi)
             y_min, y_max = self.getViewBox().viewRange()[1]
-            return self.plot(
-                [x0, x0], [y_min, y_max],
-                pen=mkPen(color, width=2),
-                symbol=None
+            self._special_line(color, filled).setData(
+                np.repeat(x_vals, 2), np.tile([y_min, y_max], len(x_vals))
             )
+            return []
         else:
             return super()._draw_special_marker(
                 freq, zr, zi,
@@ -481,6 +719,9 @@ class PhaseGraph(ParentGraph):
         
                     
 class BodeGraph(ParentGraph):
+    X_RANGE = (-2.2, 6.08)
+    Y_RANGE = (2.8, 7.4)
+
     def __init__(self, print_mode=False):
         super().__init__(print_mode)
         self.setMouseTracking(True)
@@ -491,25 +732,29 @@ class BodeGraph(ParentGraph):
         self.setLabel('left', "Log10 Magnitude [dB]")
         
         self.getViewBox().invertX(True)
-
-    def _prepare_xy(self, freq, z_real, z_imag):
-        freq_log = np.log10(freq)
-        mag = np.sqrt(z_real**2 + z_imag**2)
-        mag_db = np.log10(mag)  # or 20*np.log10(mag) if you really want dB
-        return freq_log, mag_db
+        self._set_edge_ticks()
+
+    def _prepare_xy(self, freq, z_real, z_imag, out=None):
+        freq = np.asarray(freq, dtype=self.DATA_DTYPE)
+        if out is None:
+            out = (np.empty_like(freq), np.empty_like(freq))
+        _bode_xy(
+            freq,
+            np.asarray(z_real, dtype=self.DATA_DTYPE),
+            np.asarray(z_imag, dtype=self.DATA_DTYPE),
+            *out
+        )
+        return out
 
     def _draw_special_marker(self, freq, zr, zi, symbol, color, filled):
         if symbol == 'x':
-            x_vals, _ = self._prepare_xy(
-                np.array([freq]), np.array([zr]), np.array([zi])
-            )
-            x0 = x_vals[0]
+            # One vertical line per point, drawn by the item of that bucket
+            x_vals, _ = self._prepare_xy(freq, zr, zi)
             y_min, y_max = self.getViewBox().viewRange()[1]
-            return self.plot(
-                [x0, x0], [y_min, y_max],
-                pen=mkPen(color, width=2),
-                symbol=None
+            self._special_line(color, filled).setData(
+                np.repeat(x_vals, 2), np.tile([y_min, y_max], len(x_vals))
             )
+            return []
         else:
             # **CORRECT super call** – keep the same order
             return super()._draw_special_marker(
@@ -522,43 +767,24 @@ class BodeGraph(ParentGraph):
         Auto-scales the view based on the static (base) plot data,
         but clamps the X range to [-2, 6] to ensure edge ticks are visible.
         """
-        # Clamp x-range to fixed hard bounds
-        x_min =-2.2
-        x_max = 6.08
-        y_min = 2.8
-        y_max = 7.4
-    
-        self._auto_range_in_progress = True
-        self.plotItem.getViewBox().setRange(
-        xRange=(x_min, x_max),
-        yRange=(y_min, y_max),
-            padding=self._autoscale_padding
-        )
-        self._auto_range_in_progress = False
-    
-        # Force edge ticks to be shown
-        self.getPlotItem().getAxis('bottom').setTicks([
-            [(i, str(i)) for i in range(int(x_min), int(x_max+1))]
-        ])
-        self.getPlotItem().getAxis('left').setTicks([
-            [(i, str(i)) for i in range(int(y_min), int(y_max+1))]
-        ])
+        # Clamp to the fixed hard bounds
+        x_min, x_max = self.X_RANGE
+        y_min, y_max = self.Y_RANGE
+        self._set_view_range((x_min, x_max), (y_min, y_max), self._autoscale_padding)
 
     
 class ColeColeGraph(ParentGraph):
     """
     Plots real(Z) vs. -imag(Z), plus a secondary manual line.
     """
+    # The axes are raw impedances, keep them at full precision
+    DATA_DTYPE = np.float64
 
     def __init__(self, print_mode=False):
         
         #modifications needed to add the third plot line
-        self._secondary_manual_data = {
-            'freq': np.array([]),
-            'Z_real': np.array([]),
-            'Z_imag': np.array([]),
-        }
-        self._original_secondary_manual_data = copy.deepcopy(self._secondary_manual_data)  # CHANGED: Save original secondary data for filtering
+        self._secondary_manual_data = self._make_series([], [], [])
+        self._original_secondary_manual_data = self._secondary_manual_data  # CHANGED: Save original secondary data for filtering
         self._secondary_plot = None
         
         # Call to parent constructor
@@ -595,17 +821,13 @@ class ColeColeGraph(ParentGraph):
         Update base/manual lines plus the secondary line.
         """
         super()._refresh_graph()
-        self._refresh_plot(self._secondary_manual_data, self._secondary_plot)
+        self._refresh_plot('secondary', self._secondary_plot)
 
     def update_parameters_secondary_manual(self, freq, Z_real, Z_imag):
-        self._secondary_manual_data = {
-            'freq': freq,
-            'Z_real': Z_real,
-            'Z_imag': Z_imag
-        }
-        self._original_secondary_manual_data = copy.deepcopy(self._secondary_manual_data)  # CHANGED: Update original secondary data for filtering
+        self._secondary_manual_data = self._make_series(freq, Z_real, Z_imag)
+        self._original_secondary_manual_data = self._secondary_manual_data  # CHANGED: Update original secondary data for filtering
         if self._secondary_plot is not None:
-            self._refresh_plot(self._secondary_manual_data, self._secondary_plot)
+            self._refresh_plot('secondary', self._secondary_plot)
 
     def filter_frequency_range(self, f_min, f_max):  # CHANGED: Overriding filter_frequency_range to include secondary data
         # Filter base and primary manual data using the parent method
@@ -613,47 +835,28 @@ class ColeColeGraph(ParentGraph):
         
         # Now filter the secondary manual data (pink line)
         if hasattr(self, '_original_secondary_manual_data'):
-            secondary_mask = (
-                (self._original_secondary_manual_data['freq'] >= f_min) &
-                (self._original_secondary_manual_data['freq'] <= f_max)
-            )
-            self._secondary_manual_data = {
-                'freq': self._original_secondary_manual_data['freq'][secondary_mask],
-                'Z_real': self._original_secondary_manual_data['Z_real'][secondary_mask],
-                'Z_imag': self._original_secondary_manual_data['Z_imag'][secondary_mask],
-            }
-            self._refresh_plot(self._secondary_manual_data, self._secondary_plot)
+            self._secondary_manual_data = self._filter_original('secondary', f_min, f_max)
+            self._refresh_plot('secondary', self._secondary_plot)
 
-    def _prepare_xy(self, freq, z_real, z_imag):
-        return z_real, -z_imag
+    def _prepare_xy(self, freq, z_real, z_imag, out=None):
+        if out is None:
+            return z_real, -z_imag
+        return z_real, np.negative(z_imag, out=out[1])
 
     def _apply_auto_scale(self):
         """
         Auto-scales the view based on the static (base) plot data,
         and ensures that (0,0) is always visible.
         """
-        x_data, y_data = self._prepare_xy(
-            self._base_data['freq'],
-            self._base_data['Z_real'],
-            self._base_data['Z_imag']
-        )
-        if x_data.size and y_data.size:
-            x_min, x_max = np.min(x_data), np.max(x_data)
-            y_min, y_max = np.min(y_data), np.max(y_data)
-    
+        x_min, x_max, y_min, y_max = self._xy_bounds('base')
+        if x_min <= x_max and y_min <= y_max:
             # Ensure (0, 0) is included in the visible range
             x_min = min(x_min, 0)
             x_max = max(x_max, 0)
             y_min = min(y_min, 0)
             y_max = max(y_max, 0)
     
-            self._auto_range_in_progress = True
-            self.plotItem.getViewBox().setRange(
-                xRange=(x_min, x_max),
-                yRange=(y_min, y_max),
-                padding= self._autoscale_padding
-            )
-            self._auto_range_in_progress = False
+            self._set_view_range((x_min, x_max), (y_min, y_max), self._autoscale_padding)
             
     def _set_print_mode(self): #rial
         super()._set_print_mode()
@@ -663,17 +866,28 @@ class ColeColeGraph(ParentGraph):
 class TimeGraph(ParentGraph):
     
     LOG_Y_AXIS = False # False # === Set this to True for a logarithmic Y‑axis (Voltage)
+    # The voltages are integrated into the chargeabilities, keep full precision
+    DATA_DTYPE = np.float64
+    # Dense time data is decimated to about this many points for the shading
+    MAX_SHADING_POINTS = 2000
+
+    # Formatters of the M-value labels and the tab title
+    _MX_FMT = "Mx= {:8.3f} ms".format
+    _MT_FMT = "Mt= {:9.3f} ms".format
+    _M0_FMT = "M0 = {:13.3f}".format
+    _TAB_FMT = "Time Domain Graph: Mx {:6.3f} ms".format
 
     def __init__(self, print_mode=False):
         
-        self._secondary_manual_data = {
-            'freq': np.array([]),
-            'Z_real': np.array([]),  # time
-            'Z_imag': np.array([]),  # voltage_up
-        }
+        self._secondary_manual_data = self._make_series([], [], [])  # (time, voltage_up)
         self._secondary_dynamic_plot = None
 
         self.mx = self.mt = self.m0 = self.Vp = None
+        # Manual dataset the shading and M-values were last computed from
+        self._shading_source = None
+        # Tab showing this graph, found on the first update once it exists
+        self._parent_tab_widget = None
+        self._parent_tab_idx = -1
         # Anchor so that (1, 0) is the reference point – top-right corner of the text.
         self.mx_text = pg.TextItem(color='w', anchor=(1, 0))
         self.mt_text = pg.TextItem(color='w', anchor=(1, 0))
@@ -692,7 +906,6 @@ class TimeGraph(ParentGraph):
         self._setup_text_items()
         self._refresh_graph()
         #self.plotItem.vb.setLimits(xMin=0.0, yMin=0.0)
-        self.plotItem.getViewBox().autoRange()
 
     def _configure_plot(self):
         self.setTitle("Time Domain Graph")
@@ -730,28 +943,19 @@ class TimeGraph(ParentGraph):
         positions in screen (scene) space. We then attach a slot to sigResized
         to update their positions whenever the plot is resized.
         """
-        vb = self.plotItem.vb
-        for txt in (self.mx_text, self.mt_text, self.m0_text):
-            txt.setParentItem(vb)
+        self._setup_text_style()
 
         # Update positions when the ViewBox is resized
-        vb.sigResized.connect(self._update_text_positions)
+        self.plotItem.vb.sigResized.connect(self._update_text_positions)
         # Ensure positions are correct immediately
         self._update_text_positions()
-            
-    def _update_text_positions(self):
+
+    def _setup_text_style(self):
         """
-        Positions the Mx, Mt, M0 labels relative to the plot size,
-        so they automatically adjust with window/DPI changes.
-    
-        ADJUST THESE to move the tags:
-          x_pct       = fraction of width to inset from the right  (increase → move left)
-          y_pct       = fraction of height to inset from the top   (increase → move down)
-          spacing_pct = fraction of height between each label      (increase → more gap)
+        Gives the Mx, Mt, M0 labels a fixed-pixel font that ignores the view
+        transformations. Done once, not on every resize.
         """
         vb = self.plotItem.vb
-    
-        # 1) Fixed-pixel font & ignore transformations
         font = pg.QtGui.QFont()
         font.setPointSizeF(15)
         font.setBold(True)
@@ -759,12 +963,25 @@ class TimeGraph(ParentGraph):
             txt.setFont(font)
             txt.setFlag(pg.QtWidgets.QGraphicsItem.ItemIgnoresTransformations, True)
             txt.setParentItem(vb)
+        self._text_view = None
+            
+    def _update_text_positions(self):
+        """
+        Positions the Mx, Mt, M0 labels relative to the plot size,
+        so they automatically adjust with window/DPI changes.
     
-        # 2) Get the view & its size in device pixels
-        views = vb.scene().views()
-        if not views:
-            return
-        view = views[0]
+        ADJUST THESE to move the tags:
+          x_pct       = fraction of width to inset from the right  (increase → move left)
+          y_pct       = fraction of height to inset from the top   (increase → move down)
+          spacing_pct = fraction of height between each label      (increase → more gap)
+        """
+        # 1) Get the view (looked up once) & its size in device pixels
+        if self._text_view is None:
+            views = self.plotItem.vb.scene().views()
+            if not views:
+                return
+            self._text_view = views[0]
+        view = self._text_view
         vp = view.viewport()
         w_px = vp.width()
         h_px = vp.height()
@@ -775,18 +992,18 @@ class TimeGraph(ParentGraph):
         spacing_pct = 0.05   #  5% of height between each label; increase for more gap
         # ====================
     
-        # 3) Compute absolute pixel offsets
+        # 2) Compute absolute pixel offsets
         x_off_px   = int(w_px * x_pct)
         y_off_px   = int(h_px * y_pct)
         spacing_px = int(h_px * spacing_pct)
     
-        # 4) Map view‑pixel positions into the scene
+        # 3) Map view‑pixel positions into the scene
         m0_scene = view.mapToScene(w_px - x_off_px, y_off_px )
         mx_scene = view.mapToScene(w_px - x_off_px, y_off_px + spacing_px)
         mt_scene = view.mapToScene(w_px - x_off_px, y_off_px + 2*spacing_px)
 
     
-        # 5) Apply positions
+        # 4) Apply positions
         self.mx_text.setPos(mx_scene)
         self.mt_text.setPos(mt_scene)
         self.m0_text.setPos(m0_scene)
@@ -805,15 +1022,46 @@ class TimeGraph(ParentGraph):
         super()._refresh_graph()
 
         # Refresh the secondary line if there's data
-        self._refresh_plot(self._secondary_manual_data, self._secondary_dynamic_plot)
+        self._refresh_plot('secondary', self._secondary_dynamic_plot)
 
         # Update the shading and M-values
         self._update_shading_and_text()
 
-        # Auto-range once at the end
-        self.plotItem.getViewBox().autoRange()
+        # Fit the view once at the end
+        self._fit_view_to_data()
 
-    def _prepare_xy(self, freq, z_real, z_imag):
+    def _fit_view_to_data(self):
+        """
+        Explicit replacement for ViewBox.autoRange(), which scans every item
+        of the plot. With auto-scale on, the autoRange result was replaced
+        straight away by _apply_auto_scale through sigRangeChanged, so that
+        is applied directly. Otherwise the view fits the visible lines
+        (manual and secondary) with autoRange's default padding.
+        """
+        if self.auto_scale_button.isChecked():
+            self._apply_auto_scale()
+            return
+
+        x_bounds, y_bounds = [], []
+        for name in ('manual', 'secondary'):
+            x, y = self._get_xy(name)
+            if self.LOG_Y_AXIS:
+                # The view works in log10(y) and ignores non-positive values
+                keep = y > 0
+                x, y = x[keep], np.log10(y[keep])
+            if x.size:
+                x_bounds += [x.min(), x.max()]
+                y_bounds += [y.min(), y.max()]
+        if not x_bounds:
+            return
+
+        self._set_view_range(
+            (min(x_bounds), max(x_bounds)),
+            (min(y_bounds), max(y_bounds)),
+            None
+        )
+
+    def _prepare_xy(self, freq, z_real, z_imag, out=None):
         """
         For this time plot: interpret Z_real as time, Z_imag as voltage.
         The freq array is not directly used here, but we keep the signature
@@ -832,81 +1080,124 @@ class TimeGraph(ParentGraph):
         """
         - The parent's manual data holds (time, voltage_down).
         - The 'secondary' line will hold (time, voltage_up).
+        The shading and M-values look up time windows by binary search, so
+        the samples are put in increasing time order here if they are not.
         """
-        super().update_parameters_manual(freq, time, voltage_down)
+        time = np.asarray(time)
+        if time.size > 1 and np.any(time[1:] < time[:-1]):
+            order = np.argsort(time, kind='stable')
+            time = time[order]
+            voltage_down = np.asarray(voltage_down)[order]
+            voltage_up = np.asarray(voltage_up)[order]
+
+        self._manual_data = self._make_series(freq, time, voltage_down)
+        self._original_manual_data = self._manual_data
 
         # Assign the secondary data (voltage_up)
-        self._secondary_manual_data = {
-            'freq': freq,
-            'Z_real': time,
-            'Z_imag': voltage_up
-        }
-        if self._secondary_dynamic_plot is not None:
-            self._refresh_plot(self._secondary_manual_data, self._secondary_dynamic_plot)
-
-        # Recompute shading and M-values
+        self._secondary_manual_data = self._make_series(freq, time, voltage_up)
+
+        # Redraw both lines once, and recompute shading and M-values
         self._refresh_graph()
 
     def _update_shading_and_text(self):
         """
         Computes the shading region, draws it via self._shading_item,
-        and updates Mx, Mt, M0 text. 
+        and updates Mx, Mt, M0 text. Skipped when the manual dataset is the
+        same object as last time, since every update replaces it.
+        Relies on the time samples being sorted (see update_parameters_manual).
         """
-        t = self._manual_data['Z_real']  # time
-        v = self._manual_data['Z_imag']  # voltage down
+        if self._manual_data is self._shading_source:
+            return
+        self._shading_source = self._manual_data
+
+        t = self._manual_data.z_real  # time
+        v = self._manual_data.z_imag  # voltage down
 
         # If there's no data, clear shading and return
         if t.size == 0 or v.size == 0:
             self._shading_item.setData([], [])
             return
 
-        # Example shading region [0.45, 1.1]
-        start_shading = 0.45
-        end_shading = 1.1
-        mask = (t >= start_shading) & (t <= end_shading)
-
-        if np.any(mask):
-            # Use the dedicated shading item so we don't add new items each time
-            self._shading_item.setData(t[mask], v[mask])
-        else:
-            # No shading in that range
-            self._shading_item.setData([], [])
-
-        # Compute M-values
-        self.Vp = np.interp(0.0, t, v)
+        # Compute M-values. A flat start (Vp ~ 0) has nothing to shade or
+        # integrate, so that case is settled before any array work
+        self.Vp = self._interp_scalar(0.0, t, v)
         if abs(self.Vp) < 1e-12:
             self.mx, self.mt, self.m0 = 0.0, 0.0, 0.0
+            self._shading_item.setData([], [])
         else:
-            integral_mx = self._integrate_chargeability(t, v, 0.45, 1.1)
-            integral_mt = self._integrate_chargeability(t, v, 0.0, 2.0)
-            v_at_0p001 = np.interp(0.001, t, v) if np.any(t >= 0.001) else 0.0
+            self._update_shading(t, v)
+
+            # Trapezoidal integrals of v(t) over [0.45, 1.1] and [0.0, 2.0]
+            integral_mx, integral_mt = _chargeabilities(t, v)
+            # t is sorted, so only its last sample needs checking
+            v_at_0p001 = self._interp_scalar(0.001, t, v) if t[-1] >= 0.001 else 0.0
 
             self.mx = 1000.0 * (integral_mx / self.Vp)
             self.mt = 1000.0 * (integral_mt / self.Vp)
             self.m0 = (v_at_0p001 / self.Vp)
 
-        # Update the text items
-        self.mx_text.setText(f"Mx= {self.mx:8.3f} ms")
-        self.mt_text.setText(f"Mt= {self.mt:9.3f} ms")
-        self.m0_text.setText(f"M0 = {self.m0:13.3f}")
+        # Update the text items, with repaints held until all three are set.
+        # Labels whose displayed text does not change are left alone
+        self.setUpdatesEnabled(False)
+        try:
+            for txt, text in ((self.mx_text, self._MX_FMT(self.mx)),
+                              (self.mt_text, self._MT_FMT(self.mt)),
+                              (self.m0_text, self._M0_FMT(self.m0))):
+                if txt.toPlainText() != text:
+                    txt.setText(text)
+        finally:
+            self.setUpdatesEnabled(True)
         
+        if self._parent_tab_widget is None:
+            self._find_parent_tab()
+        if self._parent_tab_widget is not None:
+            self._parent_tab_widget.setTabText(
+                self._parent_tab_idx, self._TAB_FMT(self.mx)
+            )
+
+    def _update_shading(self, t, v):
+        """Shades the region [0.45, 1.1] under v(t), a slice since t is sorted."""
+        start_shading = 0.45
+        end_shading = 1.1
+        i0 = np.searchsorted(t, start_shading, side='left')
+        i1 = np.searchsorted(t, end_shading, side='right')
+
+        if i1 > i0:
+            # Use the dedicated shading item so we don't add new items each time.
+            # The filled polygon never needs more than ~2000 vertices on screen
+            stride = max(1, (i1 - i0) // self.MAX_SHADING_POINTS)
+            self._shading_item.setData(t[i0:i1:stride], v[i0:i1:stride])
+        else:
+            # No shading in that range
+            self._shading_item.setData([], [])
+
+    def _find_parent_tab(self):
+        """
+        Looks up the QTabWidget holding this graph and its tab index. Only
+        cached once found, as the graph is put in its tab after construction.
+        """
         w = self
         while w is not None and not isinstance(w, QTabWidget):
             w = w.parentWidget()
         if isinstance(w, QTabWidget):
             idx = w.indexOf(self)
             if idx != -1:
-                w.setTabText(idx, f"Time Domain Graph: Mx {self.mx:6.3f} ms")
+                self._parent_tab_widget = w
+                self._parent_tab_idx = idx
 
     @staticmethod
-    def _integrate_chargeability(t, v, tmin, tmax):
+    def _interp_scalar(x0, t, v):
         """
-        Simple trapezoidal integration of v(t) from tmin to tmax.
+        Linear interpolation of v(t) at the single point x0, clamped to the
+        end values like np.interp, without its array dispatch overhead.
         """
-        mask = (t >= tmin) & (t <= tmax)
-        if not np.any(mask):
-            return 0.0
-        return np.trapz(y=v[mask], x=t[mask])
+        i = np.searchsorted(t, x0, side='right')
+        if i == 0:
+            return v[0]
+        if i >= t.size:
+            return v[-1]
+        f = (x0 - t[i - 1]) / (t[i] - t[i - 1])
+        return v[i - 1] + f * (v[i] - v[i - 1])
 
     def get_special_values(self):
         """
@@ -915,43 +1206,19 @@ class TimeGraph(ParentGraph):
         return {'mx': self.mx, 'mt': self.mt, 'm0': self.m0, 'Vp': self.Vp}
 
     def _apply_auto_scale(self):
-        # Collect base data
-        x_base, y_base = self._prepare_xy(
-            self._base_data['freq'],
-            self._base_data['Z_real'],
-            self._base_data['Z_imag'],
-        )
-        # Collect manual (time) data
-        x_manual, y_manual = self._prepare_xy(
-            self._manual_data['freq'],
-            self._manual_data['Z_real'],
-            self._manual_data['Z_imag'],
-        )
-        # Optionally collect secondary data
-        x_sec, y_sec = self._prepare_xy(
-            self._secondary_manual_data['freq'],
-            self._secondary_manual_data['Z_real'],
-            self._secondary_manual_data['Z_imag'],
-        )
-
-        # Combine them all
-        all_x = np.concatenate([x_base, x_manual, x_sec])
-        all_y = np.concatenate([y_base, y_manual, y_sec])
+        # Combine the bounds of base, manual (time) and secondary data,
+        # without concatenating the data
+        bounds = [self._xy_bounds(name) for name in self._DATA_ATTRS]
+        x_min = min(b[0] for b in bounds)
+        x_max = max(b[1] for b in bounds)
+        y_min = min(b[2] for b in bounds)
+        y_max = max(b[3] for b in bounds)
 
         # Skip if empty
-        if all_x.size == 0 or all_y.size == 0:
+        if x_min > x_max or y_min > y_max:
             return
 
-        x_min, x_max = np.min(all_x), np.max(all_x)
-        y_min, y_max = np.min(all_y), np.max(all_y)
-
-        self._auto_range_in_progress = True
-        self.plotItem.getViewBox().setRange(
-            xRange=(x_min, x_max),
-            yRange=(y_min, y_max),
-            padding=0.0
-        )
-        self._auto_range_in_progress = False
+        self._set_view_range((x_min, x_max), (y_min, y_max), 0.0)
         
     def _set_print_mode(self): 
         super()._set_print_mode()
@@ -970,10 +1237,12 @@ class WidgetGraphs(QWidget):
     A widget with multiple graphs in a split/tabbed layout.
     """
     
-    def __init__(self, print_mode:bool = False):
+    def __init__(self, print_mode:bool = False, use_opengl:bool = False):
         super().__init__()
         
         print(f"print mode is: {print_mode}")
+        if use_opengl:
+            _enable_opengl()
         
         self._init_graphs(print_mode)
         self._init_ui()
@@ -1052,6 +1321,18 @@ class WidgetGraphs(QWidget):
         self._small_graph_2.reset_default_values()
         self._tab_graph.reset_default_values()
     
+    @contextmanager
+    def batch_updates(self):
+        """
+        Holds repaints of all graphs while several updates are applied, so
+        they show in a single paint when the block ends.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+
     def update_front_graphs(self, freq, z_real, z_imag):
         self._big_graph.update_parameters_base(freq, z_real, z_imag)
         self._small_graph_1.update_parameters_base(freq, z_real, z_imag)
@@ -1066,19 +1347,19 @@ class WidgetGraphs(QWidget):
         z_imag_main = calc_result.main_z_imag
         z_rock_real = calc_result.rock_z_real
         z_rock_imag = calc_result.rock_z_imag
-
-        self._big_graph.update_parameters_manual(freq_main, z_real_main, z_imag_main)
-        self._small_graph_1.update_parameters_manual(freq_main, z_real_main, z_imag_main)
-        self._small_graph_2.update_parameters_manual(freq_main, z_real_main, z_imag_main)
-
-        self._big_graph.update_parameters_secondary_manual(freq_main, z_rock_real, z_rock_imag)
-
         freq_sp = calc_result.special_freq
         z_real_sp = calc_result.special_z_real
         z_imag_sp = calc_result.special_z_imag
-        self._big_graph.update_special_frequencies(freq_sp, z_real_sp, z_imag_sp)
-        self._small_graph_1.update_special_frequencies(freq_sp, z_real_sp, z_imag_sp)
-        self._small_graph_2.update_special_frequencies(freq_sp, z_real_sp, z_imag_sp)
+
+        big, small_1, small_2 = self._big_graph, self._small_graph_1, self._small_graph_2
+
+        for graph in (big, small_1, small_2):
+            graph.update_parameters_manual(freq_main, z_real_main, z_imag_main)
+
+        big.update_parameters_secondary_manual(freq_main, z_rock_real, z_rock_imag)
+
+        for graph in (big, small_1, small_2):
+            graph.update_special_frequencies(freq_sp, z_real_sp, z_imag_sp)
 
         self._tab_graph.update_parameters_manual(
             calc_result.timedomain_freq,
@@ -1100,12 +1381,13 @@ class WidgetGraphs(QWidget):
 #  Quick Test
 # -----------------------------------------------------------------------
 import sys
+from types import SimpleNamespace
 import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QHBoxLayout, QVBoxLayout,
     QSlider, QLabel
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 
 ###############################################################################
 # TestWidget
@@ -1118,6 +1400,12 @@ class TestWidget(QWidget):
         # 1) Create the main "WidgetGraphs" container
         self.graphs = WidgetGraphs()
 
+        # Coalesce bursts of slider ticks into one redraw every 30 ms
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(30)
+        self._update_timer.timeout.connect(self._do_update_blue_line)
+
         # 2) Create sliders & labels for parameters
         params = [("param1", 20), ("param2", 10), ("param3", 5)]
         self.sliders, self.labels = {}, {}
@@ -1151,9 +1439,13 @@ class TestWidget(QWidget):
         freq, z_real, z_imag, time, volt = self.base_data
         self.graphs.update_front_graphs(freq, z_real, z_imag)    # Cole/Bode/Phase
         self.graphs.update_timedomain_graph(freq, time, volt)    # TimeGraph
+        # Scratch arrays the manual data is written into on every update
+        self._manual_buffers = (
+            np.empty_like(z_real), np.empty_like(z_imag), np.empty_like(volt)
+        )
 
         # 5) Initial draw of the manual lines (blue & pink)
-        self._update_blue_line()
+        self._do_update_blue_line()
 
     @staticmethod
     def _generate_base_data(num_points=50):
@@ -1168,10 +1460,11 @@ class TestWidget(QWidget):
         return freq, z_real, z_imag, time, volt
 
     @staticmethod
-    def _generate_manual_data(base_data, param1, param2, param3):
+    def _generate_manual_data(base_data, param1, param2, param3, out=None):
         """
         Generates the 'manual' (blue) line data from the base data,
         with transformations to make changes clearly visible.
+        The z_real, z_imag and volt results are written into out if given.
         """
         freq, z_real, z_imag, time, volt = base_data
 
@@ -1181,14 +1474,28 @@ class TestWidget(QWidget):
         offset_z = param2 * 0.5
         offset_v = param3 / 20.0
 
+        if out is None:
+            out = (np.empty_like(z_real), np.empty_like(z_imag), np.empty_like(volt))
+        z_real_out, z_imag_out, volt_out = out
+
         freq_out = freq
-        z_real_out = factor * (z_real + offset_z)
-        z_imag_out = factor * (z_imag + offset_z)
-        volt_out = factor * volt + offset_v
+        np.add(z_real, offset_z, out=z_real_out)
+        z_real_out *= factor
+        np.add(z_imag, offset_z, out=z_imag_out)
+        z_imag_out *= factor
+        np.multiply(volt, factor, out=volt_out)
+        volt_out += offset_v
 
         return freq_out, z_real_out, z_imag_out, time, volt_out
 
     def _update_blue_line(self):
+        """
+        Schedules a redraw of the manual lines. Restarting the timer on every
+        slider tick means a drag redraws once it pauses, not on every tick.
+        """
+        self._update_timer.start()
+
+    def _do_update_blue_line(self):
         """
         1) Re-compute the 'manual' (blue) data from sliders,
         2) Update it in all relevant graphs,
@@ -1205,27 +1512,25 @@ class TestWidget(QWidget):
 
         # -- 1) Update the BLUE line --
         freq, z_real, z_imag, time, volt = self._generate_manual_data(
-            self.base_data, p1, p2, p3
+            self.base_data, p1, p2, p3, out=self._manual_buffers
         )
 
-        # Update the 'blue line' (manual) in Cole/Bode/Phase
-        self.graphs._big_graph.update_parameters_manual(freq, z_real, z_imag)
-        self.graphs._small_graph_1.update_parameters_manual(freq, z_real, z_imag)
-        self.graphs._small_graph_2.update_parameters_manual(freq, z_real, z_imag)
-
-        # Update the 'blue line' in the TimeDomain
-        self.graphs._tab_graph.update_parameters_manual(freq, time, volt, -volt)
-
-        # -- 2) Update the PINK (secondary) line in ColeColeGraph --
+        # -- 2) The PINK (secondary) line in ColeColeGraph --
         # Create a bigger shift so the pink line is clearly different:
-        freq2 = freq * (1.2 + p1 / 15.0)
         z_real2 = z_real + 30 + 2 * p2
         z_imag2 = z_imag - 30 - 2 * p3
 
-        # This method is only valid on ColeColeGraph
-        self.graphs._big_graph.update_parameters_secondary_manual(
-            freq2, z_real2, z_imag2
+        # Send everything through the same entry point Main uses: blue line
+        # in Cole/Bode/Phase and TimeDomain, pink line, no special markers
+        no_points = np.array([])
+        calc_result = SimpleNamespace(
+            main_freq=freq, main_z_real=z_real, main_z_imag=z_imag,
+            rock_z_real=z_real2, rock_z_imag=z_imag2,
+            special_freq=no_points, special_z_real=no_points, special_z_imag=no_points,
+            timedomain_freq=freq, timedomain_time=time,
+            timedomain_volt_down=volt, timedomain_volt_up=-volt,
         )
+        self.graphs.update_manual_plot(calc_result)
 
     def _handle_reset_defaults(self):
         self.graphs.reset_default_values()
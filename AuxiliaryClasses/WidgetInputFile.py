@@ -7,86 +7,178 @@ A widget for selecting a folder of input files and extracting data from them.
 Renamed from 'InputFileWidget' to 'WidgetInputFile' to match updated class naming conventions.
 """
 
+import io
+import mmap
 import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
 import numpy as np
-import pandas as pd
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QFileDialog, QHBoxLayout, QFileDialog, 
     QInputDialog, QFileDialog, QMenu, QAction, QMessageBox, QSizePolicy, QLineEdit, QLayout
 )
-from PyQt5.QtCore import pyqtSignal, Qt, QPoint
+from PyQt5.QtCore import pyqtSignal, Qt, QPoint, QObject, QRunnable, QThreadPool
 from PyQt5.QtGui import QFontMetrics
 from .ConfigImporter import ConfigImporter
 from .CustomListSliders import ListSlider
 
 
-#this is a file type. SHould I define a proper class?
-class NewZFile:
+@dataclass(frozen=True, slots=True)
+class FileTypeSpec:
     """
-    Handles writing rows of data to CSV files safely.
+    Layout of one supported input file format: its extension (lowercase),
+    the header rows to skip, the data columns and their separator.
     """
+    name: str
+    supported_file_extension: str
+    skip_rows: int
+    freq_column: int
+    z_real_column: int
+    z_imag_column: int
+    step: Optional[str]  # None: any run of whitespace
+
+    def __post_init__(self):
+        # Checked once, when the file types are defined at import
+        if not self.supported_file_extension.startswith('.') or \
+                self.supported_file_extension != self.supported_file_extension.lower():
+            raise ValueError(
+                f"FileTypeSpec '{self.name}': extension must be lowercase and start with '.'")
+        if min(self.skip_rows, self.freq_column, self.z_real_column, self.z_imag_column) < 0:
+            raise ValueError(
+                f"FileTypeSpec '{self.name}': rows and columns must be non-negative")
+
+
+NEW_Z_FILE = FileTypeSpec(
+    name='*.Z',
+    supported_file_extension='.z',
+    skip_rows=128,
+    freq_column=0,
+    z_real_column=4,
+    z_imag_column=5,
+    step='\t',
+)
+
+OLD_Z_FILE = FileTypeSpec(
+    name='Old .Z',
+    supported_file_extension='.z',
+    skip_rows=11,
+    freq_column=0,
+    z_real_column=4,
+    z_imag_column=5,
+    step=',',
+)
+
+GAMRY_FILE = FileTypeSpec(
+    name='Gamry',
+    supported_file_extension='.dta',
+    skip_rows=98,
+    freq_column=2,
+    z_real_column=3,
+    z_imag_column=4,
+    step=None,
+)
+
+# Sent for all three columns when a file can't be read. float64 like the
+# parsed data; having no elements, it is safe to share.
+_EMPTY_COLUMN = np.empty(0, dtype=np.float64)
     
-    name='*.Z'
-    
-    caracteristics={
-        'supported_file_extension': '.z', 
-        'skip_rows': '128', 
-        'freq_column': '0', 
-        'z_real_column': '4', 
-        'z_imag_column': '5'
-    }
-    step ='\t'
-    
-    
-class OldZFile:
+
+def _data_start(buf, skip_rows):
     """
-    Handles writing rows of data to CSV files safely.
+    Offset of the first byte after the first skip_rows lines of buf, or
+    len(buf) if it has fewer lines. The instrument headers never hold
+    quoted newlines, so counting b'\n' (a memchr scan) finds the rows.
     """
-    name='Old .Z'
-    
-    caracteristics={
-        'supported_file_extension': '.z', 
-        'skip_rows': '11', 
-        'freq_column': '0', 
-        'z_real_column': '4', 
-        'z_imag_column': '5'
-    }
-    step =','
-    
-    
-class GamryFile:
+    start = 0
+    for _ in range(skip_rows):
+        start = buf.find(b'\n', start) + 1
+        if start == 0:
+            return len(buf)
+    return start
+
+
+def _read_file_columns(file_path, file_type, max_rows=None):
     """
-    Handles writing rows of data to CSV files safely.
+    Reads the frequency, real Z and imaginary Z columns of the file at
+    file_path, laid out as described by file_type (a FileTypeSpec).
+    With max_rows, only the first max_rows data rows are read.
     """
-    name='Gamry'
-    
-    caracteristics={
-        'supported_file_extension': '.DTA', 
-        'skip_rows': '98', 
-        'freq_column': '2', 
-        'z_real_column': '3', 
-        'z_imag_column': '4'
-    }
-    step =r'\s+'
-    
+    # The file is memory-mapped and its header rows are skipped by finding
+    # newlines in the map, so only the data rows are copied and decoded
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            body = b''  # mmap refuses empty files
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                body = mm[_data_start(mm, file_type.skip_rows):]
+    text = body.decode("cp1252")
+
+    # Only the three needed columns are parsed. A missing column
+    # makes loadtxt raise, which is reported like any read error
+    data = np.loadtxt(
+        io.StringIO(text),
+        delimiter=file_type.step,
+        usecols=(
+            file_type.freq_column,
+            file_type.z_real_column,
+            file_type.z_imag_column,
+        ),
+        ndmin=2,
+        comments=None,  # the data rows never hold comments
+        max_rows=max_rows  # counts data rows, skipping blank lines
+    )
+    # One (3, N) block, so each column emitted is a contiguous view
+    freq, z_real, z_imag = np.ascontiguousarray(data.T)
+    return freq, z_real, z_imag
+
+
+class _ParseJobSignals(QObject):
+    """Signals of a _ParseJob, delivered to the GUI thread."""
+    finished = pyqtSignal(int, object, object, object)  # request id, cache key, file type, columns
+    failed = pyqtSignal(int, str, object)  # request id, file path, exception
+
+
+class _ParseJob(QRunnable):
+    """
+    Reads one input file on a QThreadPool thread and reports the columns,
+    or the error, through its signals.
+    """
+    def __init__(self, request_id, key, file_type):
+        super().__init__()
+        self.signals = _ParseJobSignals()
+        self._request_id = request_id
+        self._key = key  # (path, mtime, size, max rows)
+        self._file_type = file_type
+
+    def run(self):
+        file_path, _, _, max_rows = self._key
+        try:
+            columns = _read_file_columns(file_path, self._file_type, max_rows)
+        except Exception as e:
+            self.signals.failed.emit(self._request_id, file_path, e)
+        else:
+            self.signals.finished.emit(self._request_id, self._key, self._file_type, columns)
+
 
 class FileTypesRegistry:
     
     def __init__(self):
         
         self._registry = {
-        NewZFile.name: NewZFile,
-        OldZFile.name: OldZFile,
-        GamryFile.name: GamryFile,
+        NEW_Z_FILE.name: NEW_Z_FILE,
+        OLD_Z_FILE.name: OLD_Z_FILE,
+        GAMRY_FILE.name: GAMRY_FILE,
     }
 
     def get_file_type(self, file_type_name):
         
-        file_cls = self._registry.get(file_type_name)
-        if file_cls is None:
+        file_type = self._registry.get(file_type_name)
+        if file_type is None:
             raise ValueError(f"Unknown file type: {file_type_name}")
-        return file_cls()
+        return file_type
     
     def get_default_file_type(self):
         default_key = list(self._registry.keys())[0]
@@ -105,20 +197,39 @@ class WidgetInputFile(QWidget):
     and emitting arrays of frequency, real Z, and imaginary Z via a signal.
     """
 
+    # freq, Z_real, Z_imag. Kept float64: they feed the fit and the values
+    # written out, the graphs downcast their own copies where it is safe
     file_data_updated = pyqtSignal(np.ndarray, np.ndarray, np.ndarray)
 
+    # Number of parsed files kept in memory for revisits
+    _PARSE_CACHE_SIZE = 64
+
+    # Text widths by (font key, text), shared by all instances
+    _ADVANCE_CACHE = {}
+
     def __init__(self, current_file=None, file_type_name=None, font = 8):
 
         super().__init__()
         # Internal state
         self._folder_path = None
+        self._folder_prefix = None  # folder path plus separator, for file paths
         self._files = []
         self._current_index = -1
+        # Parsed (freq, z_real, z_imag), by (path, mtime, size, max rows), oldest first
+        self._parse_cache = OrderedDict()
+        # ((folder, extension, folder mtime), sorted file names) of the last scan
+        self._listing_cache = None
+        # ((path, mtime, size, max rows), file type) of the last data emitted
+        self._last_emitted = None
+        # Id of the latest content request, and the job parsing it
+        self._parse_request_id = 0
+        self._parse_job = None
+        # Cap on the data rows read per file (None: whole file)
+        self._max_rows = None
         
         #file type related options
         self.registry = FileTypesRegistry() 
         self._file_type = None
-        self.config_p = None
         
         # Build the UI layout
         self.font = font
@@ -148,7 +259,7 @@ class WidgetInputFile(QWidget):
         Returns the absolute path of the currently displayed file.
         """
         if 0 <= self._current_index < len(self._files):
-            return os.path.join(self._folder_path, self._files[self._current_index])
+            return self._folder_prefix + self._files[self._current_index]
         return None
 
     def get_current_file_name(self) -> str:
@@ -173,13 +284,25 @@ class WidgetInputFile(QWidget):
         self._initialize_file_type_parameters(current_file_type)
         self._setup_current_file(current_file)
             
+    def set_max_rows(self, max_rows):
+        """
+        Limits the data rows read from each file to max_rows, for quick
+        previews of large sweeps. None (the default) reads whole files.
+        """
+        if max_rows == self._max_rows:
+            return
+        self._max_rows = max_rows
+        # The current file is read again, with the new cap
+        self._last_emitted = None
+        self._update_file_display()
+
     def force_emit_signal(self):
 
         if 0 <= self._current_index < len(self._files):
             current_file = self._files[self._current_index]
         else: return
         # Build full path and extract the file's content
-        file_path = os.path.join(self._folder_path, current_file)
+        file_path = self._folder_prefix + current_file
         self._extract_content(file_path)
 
     # -----------------------------------------------------------------------
@@ -200,6 +323,7 @@ class WidgetInputFile(QWidget):
         self.previous_button = QPushButton("<")
         self.next_button = QPushButton(">")
         self.file_label = QLabel("No file selected")
+        self._file_type_menu = self._create_file_type_menu()
         # Slider
         self._slider = ListSlider(font = self.font)
         self._slider.setMinimumWidth(400)
@@ -229,9 +353,7 @@ class WidgetInputFile(QWidget):
         slider_container.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         
         # Configure input box width ---
-        font = self._input_box.font()
-        metrics = QFontMetrics(font)
-        text_width = metrics.horizontalAdvance("9999")
+        text_width = self._text_advance(self._input_box.font(), "9999")
         padding = 5
         self._input_box.setFixedWidth(text_width + padding)
         
@@ -284,6 +406,15 @@ class WidgetInputFile(QWidget):
         slider_layout.addWidget(self._slider, 0, Qt.AlignTop)
         return slider_container
 
+    @classmethod
+    def _text_advance(cls, font, text):
+        """Return the cached horizontal advance of text in the given font."""
+        key = (font.key(), text)
+        advance = cls._ADVANCE_CACHE.get(key)
+        if advance is None:
+            advance = cls._ADVANCE_CACHE[key] = QFontMetrics(font).horizontalAdvance(text)
+        return advance
+
     def _apply_styles_and_sizing(self):
         """Apply font sizes, padding, and size policies."""
         
@@ -291,23 +422,23 @@ class WidgetInputFile(QWidget):
         file_label_font.setPointSizeF(self.font + 1)
         self.file_label.setFont(file_label_font)
         
+        # All buttons share the same font, so it is measured only once
+        f = self.select_folder_button.font()
+        f.setPointSize(self.font)
+        fm = QFontMetrics(f)
         for btn in (
             self.select_folder_button,
             self.select_file_type_button,
             self.previous_button,
             self.next_button
         ):
-            f = btn.font()
-            f.setPointSize(self.font)
             btn.setFont(f)
-    
-            fm = QFontMetrics(f)
             btn.setFixedHeight(fm.height() + 9)
             btn.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
     
             # Set width only for previous/next buttons ("<" and ">")
             if btn in [self.previous_button, self.next_button]:
-                symbol_width = fm.horizontalAdvance(btn.text())
+                symbol_width = self._text_advance(f, btn.text())
                 padding = 20  # Add a bit of extra space
                 btn.setFixedWidth(symbol_width + padding)
             else:
@@ -335,8 +466,8 @@ class WidgetInputFile(QWidget):
         # Input box related
         self._slider.valueChanged.connect(self._slider_update_handler)
         self._slider.new_list_was_set.connect(lambda length: self._length_slider_label.setText(f"/{length}"))
-        self._slider.valueChanged.connect(lambda v: self._input_box.setText(str(v + 1))) #mine
-        self._input_box.editingFinished.connect(self._handle_input_box_update)
+        self._slider.valueChanged.connect(self._on_slider_value)
+        self._input_box.editingFinished.connect(self._handle_input_box_update, Qt.UniqueConnection)
         
     # Configuration of file type
     def _initialize_file_type_parameters(self, file_type_name):
@@ -346,9 +477,8 @@ class WidgetInputFile(QWidget):
         else: 
             self._file_type = self.registry.get_file_type(file_type_name)
 
-        self.config_p = self._file_type.caracteristics
-        # Immediately validate and cast
-        self._validate_type_parameters()
+        # Parsed content depends on the file type's rows and columns
+        self._parse_cache.clear()
     
     def _validate_given_parameters(self, current_file, file_type_name):
                  
@@ -358,52 +488,20 @@ class WidgetInputFile(QWidget):
         dot_index = current_file.rfind('.')
         
         # Extract the extension (including the dot)
-        file_extension = current_file[dot_index:]
-        expected_file_extension = self.registry.get_file_type(file_type_name).caracteristics['supported_file_extension']
+        file_extension = current_file[dot_index:].lower()
+        expected_file_extension = self.registry.get_file_type(file_type_name).supported_file_extension
 
         if not file_extension == expected_file_extension:
             return None, None
         
         return current_file, file_type_name
     
-    def _validate_type_parameters(self):
-        """
-        Validates that all required configuration parameters are present.
-        Raises a ValueError if any are missing.
-        """
-        needed_parameters = [
-            'supported_file_extension',
-            'skip_rows',
-            'freq_column',
-            'z_real_column',
-            'z_imag_column'
-        ]
-        missing_params = [param for param in needed_parameters if param not in self.config_p]
-        if missing_params:
-            missing = ', '.join(missing_params)
-            raise ValueError(f"WidgetInputFile._validate_parameters: Configuration must include parameters: {missing}")
-        else:
-            self.config_p=self._cast_config_parameters(self.config_p)
-    
-    def _cast_config_parameters(self, config_parameters):
-        
-        try:
-            return {
-                'supported_file_extension': config_parameters['supported_file_extension'].lower(),
-                'skip_rows': int(config_parameters['skip_rows']),
-                'freq_column': int(config_parameters['freq_column']),
-                'z_real_column': int(config_parameters['z_real_column']),
-                'z_imag_column': int(config_parameters['z_imag_column'])
-            }
-        except (KeyError, ValueError) as e:
-            raise ValueError(f"WidgetInputFile._cast_config_parameters:Invalid configuration parameters: {e}")
-
     #Configuration oc current input
     def _setup_current_file(self, current_file:str):
         
         if current_file and os.path.isfile(current_file):
             folder_path = os.path.dirname(current_file)
-            self._folder_path = folder_path
+            self._set_folder_path(folder_path)
             self._load_files(skip_extract_default_file=True)#this is the one who needs to have the flag
             file_name = os.path.basename(current_file)#this would need to dissapear I guess?
 
@@ -420,7 +518,7 @@ class WidgetInputFile(QWidget):
             folder_path = os.path.dirname(current_file)
             
             if os.path.isdir(folder_path):
-                self._folder_path = folder_path
+                self._set_folder_path(folder_path)
                 self._load_files()
                 print(f"WidgetImputFile.setup_current_file: File '{os.path.basename(current_file)}' was not found in the folder '{self._folder_path}'.")
             else:
@@ -434,9 +532,17 @@ class WidgetInputFile(QWidget):
         """
         folder = QFileDialog.getExistingDirectory(self, "Select Folder")
         if folder:
-            self._folder_path = folder
+            self._set_folder_path(folder)
             self._load_files()
 
+    def _set_folder_path(self, folder_path):
+        """
+        Sets the input folder, and the prefix the file paths are built from
+        (os.path.join once, instead of on every navigation).
+        """
+        self._folder_path = folder_path
+        self._folder_prefix = os.path.join(folder_path, '')
+
     def _load_files(self, skip_extract_default_file=False):
         """
         Scans the selected folder for files matching the supported extension,
@@ -444,12 +550,25 @@ class WidgetInputFile(QWidget):
         """
 
         if self._folder_path:
-            supported_ext = self.config_p["supported_file_extension"]
-            self._files = [
-                f for f in os.listdir(self._folder_path)
-                if f.lower().endswith(supported_ext)
-            ]
-            self._files = sorted(self._files, key=str.casefold)
+            supported_ext = self._file_type.supported_file_extension
+            # A folder whose mtime did not change still has the same files,
+            # so its listing for this extension is reused
+            key = (self._folder_path, supported_ext, os.stat(self._folder_path).st_mtime_ns)
+            if self._listing_cache is not None and self._listing_cache[0] == key:
+                self._files = list(self._listing_cache[1])
+            else:
+                # scandir's is_file() reuses the directory listing's file type
+                # on most systems, so there is no stat call per file
+                with os.scandir(self._folder_path) as entries:
+                    self._files = sorted(
+                        (e.name for e in entries
+                         if e.name.lower().endswith(supported_ext) and e.is_file()),
+                        key=str.casefold
+                    )
+                self._listing_cache = (key, tuple(self._files))
+            if not self._files:
+                # No file will be requested, so drop any parse still running
+                self._parse_request_id += 1
             if not skip_extract_default_file:
                 self._extract_default_file_from_folder()
             
@@ -463,7 +582,7 @@ class WidgetInputFile(QWidget):
             self._update_navigation_buttons()
         else:
             self.file_label.setText(
-                f'WidgetImputFile._extract_default_file_from_folder: No {self.config_p["supported_file_extension"]} files found in the selected folder.'
+                f'WidgetImputFile._extract_default_file_from_folder: No {self._file_type.supported_file_extension} files found in the selected folder.'
             )
             self.previous_button.setEnabled(False)
             self.next_button.setEnabled(False)
@@ -484,47 +603,77 @@ class WidgetInputFile(QWidget):
         self._slider.blockSignals(True)
         self._slider.setValue(self._current_index)
         self._slider.blockSignals(False)
-        self._input_box.setText(str(self._current_index + 1))
+        self._on_slider_value(self._current_index)
 
-        # Build full path and extract the file's content
-        file_path = os.path.join(self._folder_path, current_file)
+        # Build full path and extract the file's content, unless it is the
+        # file just sent, unmodified since (force_emit_signal always sends
+        # it again). A file that can't be stat'ed is left to _extract_content
+        file_path = self._folder_prefix + current_file
+        try:
+            key = self._content_key(file_path)
+        except OSError:
+            key = None
+        if key is not None and (key, self._file_type) == self._last_emitted:
+            return
         self._extract_content(file_path)
 
+    def _content_key(self, file_path):
+        """
+        Returns the (path, mtime, size, max rows) key of the file's parsed
+        content. Raises OSError if the file can't be stat'ed.
+        """
+        stat = os.stat(file_path)
+        return (file_path, stat.st_mtime_ns, stat.st_size, self._max_rows)
+
     #Content extraction from selected file
     def _extract_content(self, file_path: str):
         """
         Reads the file at file_path using the specified configuration,
-        and emits a signal with the extracted data.
+        and emits a signal with the extracted data. Files not in the cache
+        are parsed by a _ParseJob on the thread pool, so the GUI stays
+        responsive; the data is emitted when the job reports back.
         """
-
-        this_step= self._file_type.step
+        # Every request supersedes the previous ones, whose results are dropped
+        self._parse_request_id += 1
         
         try:
-            df = pd.read_csv(
-                file_path,
-                sep=this_step,
-                skiprows=self.config_p["skip_rows"],
-                header=None,
-                
-                encoding="cp1252"  
-            )
-            freq_col = self.config_p["freq_column"]
-            z_real_col = self.config_p["z_real_column"]
-            z_imag_col = self.config_p["z_imag_column"]
-            max_col = max(freq_col, z_real_col, z_imag_col)
-    
-            if max_col >= len(df.columns):
-                raise ValueError("WidgetInputFile._extract_content :File does not contain the required columns.")
-    
-            freq = df[freq_col].to_numpy()
-            z_real = df[z_real_col].to_numpy()
-            z_imag = df[z_imag_col].to_numpy()
-    
-            # Instead of empty arrays, send the arrays we just read:
-            self.file_data_updated.emit(freq, z_real, z_imag)
-    
+            # A revisited, unmodified file is served from the cache
+            key = self._content_key(file_path)
+            cached = self._parse_cache.get(key)
+            if cached is not None:
+                self._parse_cache.move_to_end(key)
+                self.file_data_updated.emit(*cached)
+                self._last_emitted = (key, self._file_type)
+                return
         except Exception as e:
             self._handle_file_read_error(e, file_path)
+            return
+
+        # Nothing is current until the job reports back
+        self._last_emitted = None
+        job = _ParseJob(self._parse_request_id, key, self._file_type)
+        job.signals.finished.connect(self._on_parse_finished)
+        job.signals.failed.connect(self._on_parse_failed)
+        self._parse_job = job
+        QThreadPool.globalInstance().start(job)
+
+    def _on_parse_finished(self, request_id, key, file_type, columns):
+        """Caches and emits the data of a finished _ParseJob, unless stale."""
+        if request_id != self._parse_request_id:
+            return
+        self._parse_cache[key] = columns
+        if len(self._parse_cache) > self._PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+
+        # Instead of empty arrays, send the arrays we just read:
+        self.file_data_updated.emit(*columns)
+        self._last_emitted = (key, file_type)
+
+    def _on_parse_failed(self, request_id, file_path, exc):
+        """Reports the error of a failed _ParseJob, unless stale."""
+        if request_id != self._parse_request_id:
+            return
+        self._handle_file_read_error(exc, file_path)
 
     def _update_navigation_buttons(self):
         """
@@ -534,34 +683,36 @@ class WidgetInputFile(QWidget):
         self.next_button.setEnabled(self._current_index < len(self._files) - 1)  
     
     #File Type Methods
+    def _create_file_type_menu(self):
+        """
+        Builds the popup menu listing the file types, with one QAction per
+        type. Done once, the menu is reused on every click.
+        """
+        menu = QMenu(self)
+        for ft in self.registry.get_available_file_types():
+            menu.addAction(QAction(ft, menu))
+        # The chosen action's text is the file type name
+        menu.triggered.connect(lambda action: self._on_file_type_selected(action.text()))
+        return menu
+
     def _select_file_type_handler(self):
 
-        file_types = self.registry.get_available_file_types()
-        
-        # Create a popup menu
-        menu = QMenu(self)
-        
-        # Add one QAction per file type
-        for ft in file_types:
-            action = QAction(ft, self)
-            
-            # Connect the action's "triggered" signal
-            # Use a lambda to capture ft in the callback
-            action.triggered.connect(lambda checked, ft_name=ft: self._on_file_type_selected(ft_name))
-            menu.addAction(action)
-        
         # Position the menu so it drops down from the button
         # We'll map to global coords and just offset below the button
         button_pos = self.select_file_type_button.mapToGlobal(QPoint(0, self.select_file_type_button.height()))
-        menu.exec_(button_pos)
+        self._file_type_menu.exec_(button_pos)
 
     def _on_file_type_selected(self, selected_type):
         """
         Internal slot called when a file type is chosen from the popup menu.
         """
+        # Picking the current type again changes nothing; skip the rescan
+        if self._file_type is not None and self._file_type.name == selected_type:
+            return
         self._file_type = self.registry.get_file_type(selected_type)
-        self.config_p = self._file_type.caracteristics
-        self._validate_type_parameters()
+        self._parse_cache.clear()
+        # A parse still running uses the old type's layout; drop its result
+        self._parse_request_id += 1
         
         # If a folder is already selected, reload the files so the new extension
         if self._folder_path:
@@ -613,9 +764,19 @@ class WidgetInputFile(QWidget):
         self.file_label.setText("Error reading file. Possibly wrong filetype.")
 
         # Emit dummy data so the program doesn't crash downstream.
-        self.file_data_updated.emit(np.array([]), np.array([]), np.array([]))
+        self._last_emitted = None
+        self.file_data_updated.emit(_EMPTY_COLUMN, _EMPTY_COLUMN, _EMPTY_COLUMN)
 
     # Input box handlers
+    def _on_slider_value(self, index: int):
+        """
+        Shows the 1-based index in the input box, leaving it untouched when
+        it already shows it (setText relayouts the box on every call).
+        """
+        text = str(index + 1)
+        if self._input_box.text() != text:
+            self._input_box.setText(text)
+
     def _handle_input_box_update(self):
         
         txt = self._input_box.text()
@@ -623,8 +784,6 @@ class WidgetInputFile(QWidget):
             self._slider.set_list_value_index(int(txt) - 1)
         else:
             print("Invalid input")
-
-        self._input_box.editingFinished.connect(self._handle_input_box_update)
          
         
 # -----------------------------------------------------------------------
@@ -1,12 +1,15 @@
 
 import os
 import csv
+import mmap
+from functools import lru_cache
+from operator import itemgetter
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel,
     QFileDialog, QHBoxLayout, QVBoxLayout, QMessageBox, QSizePolicy
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool
 from PyQt5.QtGui import QFontMetrics, QPalette, QColor
 
 class ErrorWindow:
@@ -21,37 +24,86 @@ class ErrorWindow:
         msg.setText(message)
         msg.exec_()
 
-class FileWriter:
+def _csv_field(value):
     """
-    Handles writing rows of data to CSV files safely.
+    Formats value as one CSV field the way csv.writer does by default:
+    None is empty, and text holding a comma, quote or line break is
+    quoted with its quotes doubled.
     """
-    @staticmethod
-    def write_to_file(file_path, rows, header=None):
-        if not file_path:
-            ErrorWindow.show_error_message("FileWriter.write_to_file: No file selected for writing.")
-            return
+    if value is None:
+        return ""
+    text = str(value)
+    if "," in text or '"' in text or "\n" in text or "\r" in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+def _csv_line(row):
+    """Formats row as one CSV line, ended like csv.writer ends it."""
+    return ",".join(map(_csv_field, row)) + "\r\n"
+
+class _WriteJobSignals(QObject):
+    """Signals of a _WriteJob, delivered to the GUI thread."""
+    failed = pyqtSignal(object, object)  # file handle, exception
+
+class _WriteJob(QRunnable):
+    """
+    Writes queued rows to an open output file on a QThreadPool thread, so
+    disk latency never blocks the GUI. Errors are reported through signals.
+    """
+    def __init__(self, fh, writer, rows):
+        super().__init__()
+        self.signals = _WriteJobSignals()
+        self._fh = fh
+        self._writer = writer  # csv.writer, or None for preformatted lines
+        self._rows = rows
+
+    def run(self):
         try:
-            with open(file_path, "a", newline="") as f:
-                writer = csv.writer(f)
-                # Header ignored for backward compatibility.
-                if isinstance(rows[0], (int, float, str)):
-                    writer.writerow(rows)
-                else:
-                    for row in rows:
-                        writer.writerow(row)
+            if self._writer is not None:
+                self._writer.writerows(self._rows)
+            else:
+                self._fh.write("".join(self._rows))
+            self._fh.flush()
         except Exception as e:
-            ErrorWindow.show_error_message(f"Could not write to file: {e}")
+            self.signals.failed.emit(self._fh, e)
 
 class FileSelector:
     """
-    Handles file creation, selection, and validation.
+    Handles file creation, selection, and validation. Each kind of dialog
+    is built once and reused, so it keeps its folder listing between uses.
     """
-    @staticmethod
-    def create_new_file(desired_type, set_file_callback, set_message_callback):
-        file_path, _ = QFileDialog.getSaveFileName(
-            None,
+    # Keeps the dialogs from stat-ing and resolving every entry of the
+    # folder shown, which is very slow on network drives
+    DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+
+    def __init__(self):
+        self._dialogs = {}  # accept mode → QFileDialog
+
+    def _run_dialog(self, accept_mode, title, name_filter):
+        """
+        Shows the dialog for accept_mode (created on first use, starting in
+        the working directory) and returns the chosen path, or "".
+        """
+        dialog = self._dialogs.get(accept_mode)
+        if dialog is None:
+            dialog = QFileDialog(None, title, os.getcwd(), name_filter)
+            dialog.setOptions(self.DIALOG_OPTIONS)
+            dialog.setAcceptMode(accept_mode)
+            if accept_mode == QFileDialog.AcceptOpen:
+                dialog.setFileMode(QFileDialog.ExistingFile)
+            self._dialogs[accept_mode] = dialog
+        else:
+            dialog.setWindowTitle(title)
+            dialog.setNameFilter(name_filter)
+            dialog.selectFile("")
+        if dialog.exec_() == QFileDialog.Accepted and dialog.selectedFiles():
+            return dialog.selectedFiles()[0]
+        return ""
+
+    def create_new_file(self, desired_type, set_file_callback, set_message_callback):
+        file_path = self._run_dialog(
+            QFileDialog.AcceptSave,
             f"Create New {desired_type} File",
-            os.getcwd(),
             "CSV Files (*.csv);;All Files (*)"
         )
         if file_path:
@@ -69,14 +121,8 @@ class FileSelector:
         else:
             set_message_callback("No file selected")
 
-    @staticmethod
-    def open_file_dialog(search_parameters, validate_callback, set_file_callback, set_message_callback):
-        file_path, _ = QFileDialog.getOpenFileName(
-            None,
-            "Select File",
-            os.getcwd(),
-            search_parameters
-        )
+    def open_file_dialog(self, search_parameters, validate_callback, set_file_callback, set_message_callback):
+        file_path = self._run_dialog(QFileDialog.AcceptOpen, "Select File", search_parameters)
         if file_path:
             try:
                 if validate_callback(file_path):
@@ -98,16 +144,49 @@ class WidgetOutputFile(QWidget):
     """
     output_file_selected = pyqtSignal(str)
 
-    def __init__(self, variables_to_print=None, output_file=None, font = 8):
+    def __init__(self, variables_to_print=None, output_file=None, font = 8, flush_threshold=1,
+                 use_csv_module=False, fsync_on_close=False):
         super().__init__()
 
         if variables_to_print is None:
             variables_to_print = []
 
         self.variables_to_print = variables_to_print
+        # Picks the row out of a dictionary in one C call when it holds
+        # every variable. A lone key would give a bare value, not a tuple
+        if len(variables_to_print) > 1:
+            self._row_getter = itemgetter(*variables_to_print)
+        else:
+            self._row_getter = lambda dictionary: tuple(dictionary[key] for key in variables_to_print)
         self._desired_type = ".csv"
         self._search_parameters = "CSV Files (*.csv);;All Files (*)"
-        self._output_file = output_file
+        self._file_selector = FileSelector()
+        self._output_file = None  # set below by _set_output_file
+        # Append handle on the output file and its writer, open while the
+        # file is selected
+        self._fh = None
+        self._csv = None
+        # Rows are formatted by _csv_field and written as one string; the
+        # csv module's writer can be used instead if some value needs it
+        self._use_csv_module = use_csv_module
+        # Turns a row into what _row_buf queues: the finished line, or the
+        # row itself for the csv module
+        self._format_row = tuple if use_csv_module else _csv_line
+        # Rows reach the OS on every flush; forcing them to disk is costly,
+        # so it is opt-in and done once, when the file is closed
+        self._fsync_on_close = fsync_on_close
+        # Rows found by find_row_in_file, by (path, mtime, size, head); a
+        # write changes the file's mtime and size, so stale entries miss
+        self._find_row_cached = lru_cache(maxsize=64)(self._find_row_in_file)
+        # Writes run on a single pool thread, so they reach the file in order
+        self._write_pool = QThreadPool(self)
+        self._write_pool.setMaxThreadCount(1)
+        self._write_job = None
+        # Rows waiting to be written, sent in one write once there are
+        # flush_threshold of them. 1 writes every row right away, which
+        # suits interactive use; bulk logging can batch with a larger value
+        self._row_buf = []
+        self.flush_threshold = max(1, int(flush_threshold))
         
         self.setAutoFillBackground(True)
         pal = self.palette()
@@ -124,6 +203,11 @@ class WidgetOutputFile(QWidget):
         self._initialize_ui()
         self._connect_signals()
         self._set_output_file(output_file)
+
+        # Child widgets get no closeEvent when the main window closes
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._close_output_handle)
         
         #self.setStyleSheet("background-color: #D3D3D3;")
 
@@ -139,10 +223,7 @@ class WidgetOutputFile(QWidget):
             ErrorWindow.show_error_message("No output file selected. Please select or create a file first.")
             return
         if self.variables_to_print:
-            FileWriter.write_to_file(
-                file_path=self._output_file,
-                rows=self.variables_to_print
-            )
+            self._write_row(self.variables_to_print)
 
     def write_to_file(self, dictionary):
         if not self._output_file:
@@ -151,43 +232,97 @@ class WidgetOutputFile(QWidget):
         if not isinstance(dictionary, dict):
             ErrorWindow.show_error_message("write_to_file requires a dictionary. Received something else.")
             return
-        row = [dictionary.get(key, "") for key in self.variables_to_print]
-        FileWriter.write_to_file(
-            file_path=self._output_file,
-            rows=row,
-            header=None
-        )
+        try:
+            row = self._row_getter(dictionary)
+        except KeyError:
+            # Missing variables are written as empty cells
+            row = [dictionary.get(key, "") for key in self.variables_to_print]
+        self._write_row(row)
+
+    def flush(self):
+        """
+        Sends the buffered rows to the output file. The write itself runs
+        on the write thread; wait_for_writes waits for it to finish.
+        """
+        if not self._row_buf:
+            return
+        rows = self._row_buf
+        self._row_buf = []
+        try:
+            if self._fh is None:
+                self._fh = open(self._output_file, "a", newline="", buffering=1 << 16)
+                self._csv = csv.writer(self._fh) if self._use_csv_module else None
+        except Exception as e:
+            ErrorWindow.show_error_message(f"Could not write to file: {e}")
+            return
+        job = _WriteJob(self._fh, self._csv, rows)
+        job.signals.failed.connect(self._on_write_failed)
+        self._write_job = job
+        self._write_pool.start(job)
+
+    def wait_for_writes(self):
+        """
+        Blocks until every row sent by flush is in the output file.
+        """
+        self._write_pool.waitForDone()
 
     def find_row_in_file(self, head):
-        try:
-            with open(self._output_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-            for line in reversed(lines):
-                columns = line.strip().split(",")
-                if columns and columns[0] == head:
-                    dictionary = dict(zip(self.variables_to_print, columns))
-                    return dictionary
+        # The row looked for may still be buffered, or being written
+        self.flush()
+        self.wait_for_writes()
+        if not isinstance(head, str):
             return None
+        try:
+            stat = os.stat(self._output_file)
+            row = self._find_row_cached(self._output_file, stat.st_mtime_ns, stat.st_size, head)
         except Exception as e:
             ErrorWindow.show_error_message(f"WidgetOutputFile.find_row_in_file: Error reading file: {e}")
             return None
+        # A copy, so callers can't alter the cached row
+        return dict(row) if row is not None else None
 
     #---------------------------
     # Private Methods
     #----------------------------
+    def _find_row_in_file(self, file_path, mtime, size, head):
+        """
+        Returns the last row of file_path whose first column is head, as a
+        dictionary by variable, or None. mtime and size only key the cache.
+        """
+        # The row looked for is usually among the last ones written, so
+        # the file is scanned from its end and only matches are decoded
+        head_bytes = head.encode("utf-8")
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None  # mmap refuses empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Walk the lines from the end by their newline offsets;
+                # a line is only copied out when its start matches head
+                end = len(mm)
+                n = len(head_bytes)
+                while end > 0:
+                    start = mm.rfind(b"\n", 0, end) + 1
+                    if mm[start:start + n] == head_bytes:
+                        line = mm[start:end].strip()
+                        if line[n:n + 1] in (b",", b""):
+                            columns = line.decode("utf-8").split(",")
+                            return dict(zip(self.variables_to_print, columns))
+                    end = start - 1
+        return None
+
     def _initialize_ui(self):
         
         layout = QHBoxLayout()
         layout.setContentsMargins(5, 0, 5, 0)
         layout.setSpacing(5)
 
+        # Both buttons share one font, so its metrics are computed once
+        f = self._newfile_button.font()
+        f.setPointSize(self.my_font_size)
+        button_height = QFontMetrics(f).height() + 9         # vertical padding
         for btn in (self._newfile_button, self._select_button):
-            f = btn.font()
-            f.setPointSize(self.my_font_size)
             btn.setFont(f)
-
-            fm = QFontMetrics(f)
-            btn.setFixedHeight(fm.height() + 9)              # vertical padding
+            btn.setFixedHeight(button_height)
             btn.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
             btn.adjustSize()   
 
@@ -216,16 +351,14 @@ class WidgetOutputFile(QWidget):
         self._select_button.clicked.connect(self._handle_open_file_dialog)
 
     def _handle_create_new_file(self):
-        FileSelector.create_new_file(
+        self._file_selector.create_new_file(
             self._desired_type,
             self._set_output_file,
             self._set_file_message
         )
-        if self.variables_to_print:
-            self.print_variables_list()
 
     def _handle_open_file_dialog(self):
-        FileSelector.open_file_dialog(
+        self._file_selector.open_file_dialog(
             self._search_parameters,
             lambda path: FileSelector.validate(path, self._desired_type),
             self._set_output_file,
@@ -233,18 +366,63 @@ class WidgetOutputFile(QWidget):
         )
 
     def _set_output_file(self, file_path):
-        if not isinstance(file_path, str):
+        # Selecting the current file again changes nothing
+        if not isinstance(file_path, str) or file_path == self._output_file:
             return
+        self._close_output_handle()
+        self._find_row_cached.cache_clear()
         self._output_file = file_path
         self._file_label.setText(os.path.basename(file_path))
         self.output_file_selected.emit(self._output_file)
         
         #coment out this line to stop the automatic heading printing when the file is opened
-        self.print_variables_list()
+        # Files that already have content already have their heading
+        try:
+            has_content = os.path.getsize(file_path) > 0
+        except OSError:
+            has_content = False
+        if not has_content:
+            self.print_variables_list()
 
     def _set_file_message(self, message):
         self._file_label.setText(message)
 
+    def _write_row(self, row):
+        """
+        Queues row for the output file, writing the queue through the
+        kept-open handle (opened on first use) once it is full.
+        """
+        self._row_buf.append(self._format_row(row))
+        if len(self._row_buf) >= self.flush_threshold:
+            self.flush()
+
+    def _close_output_handle(self, flush=True):
+        # Rows still queued belong to the file being closed
+        if flush:
+            self.flush()
+        self.wait_for_writes()
+        if self._fh is not None:
+            try:
+                if self._fsync_on_close:
+                    self._fh.flush()
+                    os.fsync(self._fh.fileno())
+                self._fh.close()
+            except OSError:
+                pass
+            self._fh = None
+            self._csv = None
+
+    def _on_write_failed(self, fh, exc):
+        # Later rows can't follow the failed ones, so that handle is dropped;
+        # the next write reopens the file
+        if fh is self._fh:
+            self._close_output_handle(flush=False)
+        ErrorWindow.show_error_message(f"Could not write to file: {exc}")
+
+    def closeEvent(self, event):
+        self._close_output_handle()
+        super().closeEvent(event)
+
 
 # -----------------------------------------------------------------------
 # Test for WidgetOutputFile
@@ -1,10 +1,9 @@
 import sys
-from functools import partial
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QSizePolicy, QPushButton
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFontMetrics
+from PyQt5.QtCore import Qt, pyqtSignal, QSignalBlocker, QTimer
+from PyQt5.QtGui import QFontMetrics, QPalette, QColor
 
 # Updated import for custom sliders.
 from .CustomSliders import EPowerSliderWithTicks, DoubleSliderWithTicks
@@ -14,7 +13,11 @@ class WidgetSliders(QWidget):
     """
     A widget that displays multiple sliders side by side, each with a label.
     The labels are color-coded. The widget emits the signal `slider_value_updated`
-    when any slider's value changes.
+    when any slider's value changes, and `sliders_batch_changed` once per pass
+    of the event loop with every value changed in it. Programmatic resets
+    (set_to_default_values, set_all_variables) don't emit `slider_value_updated`
+    or `sliders_batch_changed` per slider; they emit one
+    `all_sliders_values_reseted` with all values instead.
     
     Parameters
     ----------
@@ -29,6 +32,7 @@ class WidgetSliders(QWidget):
     slider_was_disabled = pyqtSignal(str, bool)
     all_sliders_values_reseted = pyqtSignal(dict)
     all_sliders_disabling_reseted = pyqtSignal(dict)
+    sliders_batch_changed = pyqtSignal(dict)
 
     def __init__(self, slider_configurations: dict, slider_default_values: list, font = 8, small_font=6):
         super().__init__()
@@ -40,6 +44,18 @@ class WidgetSliders(QWidget):
         
         # Create sliders with flexible sizing.
         self.sliders = self._create_sliders(slider_configurations)
+        # (key, slider) and (key, slider, default) in default-values order,
+        # walked by the methods below without per-key dict lookups
+        self._ordered_items = tuple(
+            (key, self.sliders[key]) for key in self.slider_default_values
+        )
+        self._default_items = tuple(
+            (key, self.sliders[key], value) for key, value in self.slider_default_values.items()
+        )
+        # Values read back after the last reset to defaults
+        self._default_snapshot = None
+        # Slider values changed since the last sliders_batch_changed
+        self._batch = {}
         
         # Set sliders to default values and states.
         self.set_to_default_values()
@@ -62,19 +78,21 @@ class WidgetSliders(QWidget):
 
     def get_all_values(self):
         """Return current values of all sliders as a dictionary."""
-        values = {}
-        for key in self.slider_default_values:
-            slider = self.sliders[key]
-            values[key] = slider.get_value()
-        return values
+        return {key: slider.get_value() for key, slider in self._ordered_items}
 
     def set_to_default_values(self):
         """Reset all sliders to their default values and emit the updated dict."""
-        values = {}
-        for key, default_value in self.slider_default_values.items():
-            slider = self.sliders[key]
-            slider.set_value(default_value)
-            values[key] = slider.get_value()
+        # Sliders still at their defaults need no new positions
+        values = self.get_all_values()
+        if values != self._default_snapshot:
+            values = {}
+            # Per-slider updates are held back; the dict below has them all
+            blocker = QSignalBlocker(self)
+            for key, slider, default_value in self._default_items:
+                slider.set_value(default_value)
+                values[key] = slider.get_value()
+            blocker.unblock()
+            self._default_snapshot = dict(values)
         self.all_sliders_values_reseted.emit(values)
         
     def set_default_disabled(self, default_values: list):
@@ -98,11 +116,15 @@ class WidgetSliders(QWidget):
             raise ValueError(
                 "WidgetSlider.set_all_variables: Incoming keys do not match the slider keys."
             )
+        # The values are read back, not echoed: set_value_exact rounds to
+        # the slider's resolution, and listeners must see what it shows
         values = {}
-        for key, val in variables.items():
-            slider = self.sliders[key]
-            slider.set_value_exact(val)
+        # Per-slider updates are held back; the dict below has them all
+        blocker = QSignalBlocker(self)
+        for key, slider in self.sliders.items():
+            slider.set_value_exact(variables[key])
             values[key] = slider.get_value()
+        blocker.unblock()
         self.all_sliders_values_reseted.emit(values)
 
     # -------------------------------
@@ -130,6 +152,11 @@ class WidgetSliders(QWidget):
     
         main_layout.setSpacing(2 )
         main_layout.setContentsMargins(0, 0, 0, 0)
+
+        # All labels share one bold font, built once, and one palette per
+        # slider colour (cheaper than parsing a style sheet per label)
+        font = None
+        palettes = {}
     
         for key, slider in self.sliders.items():
             slider_layout = QVBoxLayout()
@@ -138,13 +165,18 @@ class WidgetSliders(QWidget):
             label = QLabel(key)
             label.setAlignment(Qt.AlignCenter)
             
-            font = label.font()
-            font.setPointSizeF(self.font)
+            if font is None:
+                font = label.font()
+                font.setPointSizeF(self.font)
+                font.setBold(True)
             label.setFont(font)
     
             # Style the label with the slider's color.
             slider_color = slider_configurations[key][3]
-            label.setStyleSheet(f"color: {slider_color}; font-weight: bold;")
+            palette = palettes.get(slider_color)
+            if palette is None:
+                palette = palettes[slider_color] = self._make_label_palette(label, slider_color)
+            label.setPalette(palette)
     
             slider_layout.addWidget(label)
             slider_layout.addSpacing(10)
@@ -153,11 +185,41 @@ class WidgetSliders(QWidget):
     
         self.setLayout(main_layout)
 
+    @staticmethod
+    def _make_label_palette(label, color):
+        """Return label's palette with its text in the given color."""
+        palette = label.palette()
+        palette.setColor(QPalette.WindowText, QColor(color))
+        return palette
+
     def _connect_signals(self):
         """Connect each slider's signals to the widget's signals."""
+        # The slot methods are bound once; each slot is a plain closure over
+        # its key, cheaper per slider move than a functools.partial
+        queue_value = self._queue_value
+        emit_disabled = self.slider_was_disabled.emit
         for key, slider in self.sliders.items():
-            slider.value_changed().connect(partial(self.slider_value_updated.emit, key))
-            slider.was_disabled.connect(partial(self.slider_was_disabled.emit, key))
+            value_changed = slider.value_changed()
+            value_changed.connect(lambda value, k=key, queue=queue_value: queue(k, value))
+            slider.was_disabled.connect(lambda state, k=key, emit=emit_disabled: emit(k, state))
+
+    def _queue_value(self, key, value):
+        """
+        Emits slider_value_updated for one slider and adds the value to the
+        batch sent by the next sliders_batch_changed.
+        """
+        # Held-back updates (programmatic resets) stay out of the batch too
+        if self.signalsBlocked():
+            return
+        self.slider_value_updated.emit(key, value)
+        if not self._batch:
+            QTimer.singleShot(0, self._emit_batch)
+        self._batch[key] = value
+
+    def _emit_batch(self):
+        batch, self._batch = self._batch, {}
+        if batch:
+            self.sliders_batch_changed.emit(batch)
 
 
 # -------------------------------
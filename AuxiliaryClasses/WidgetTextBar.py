@@ -1,4 +1,5 @@
 import sys
+from functools import lru_cache
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
     QApplication, QHBoxLayout, QVBoxLayout,  #  ← added QVBoxLayout
@@ -24,12 +25,15 @@ class WidgetTextBar(QWidget):
         self.default_text  = "Comment"
         self.value_labels  = {}              # key → QLabel
         self.key_colors    = {}              # key → colour string
+        self._prefix       = {}              # key → label HTML before the value
+        self._last_val     = {}              # key → value currently shown
+        self._pending      = {}              # key → value received while hidden
         self._user_comment = self.default_text
         self._user_comment  = ""
 
         # Build UI
         keys_1 = keys_1 or []
-        ordered_keys = self._sort_keys_by_suffix(keys_1)
+        ordered_keys = self._sort_keys_by_suffix(frozenset(keys_1))
         self._build_ui(ordered_keys)
 
     # --------------------------
@@ -47,12 +51,16 @@ class WidgetTextBar(QWidget):
     # Internal helpers
     # --------------------------
     @staticmethod
+    @lru_cache(maxsize=32)
     def _sort_keys_by_suffix(keys):
-        """Return keys grouped by final letter (h/m/l) then alphabetic."""
+        """
+        Return keys (a frozenset, so calls with the same keys hit the cache)
+        as a tuple grouped by final letter (h/m/l) then alphabetic.
+        """
         buckets = {"h": [], "m": [], "l": [], "other": []}
         for k in keys:
             buckets[k[-1] if k[-1] in buckets else "other"].append(k)
-        return (
+        return tuple(
             sorted(buckets["h"], reverse=True) +
             sorted(buckets["m"], reverse=True) +
             sorted(buckets["l"], reverse=True) +
@@ -71,6 +79,9 @@ class WidgetTextBar(QWidget):
         font.setPointSize(self.my_font_size)              
         fm = QFontMetrics(font)
         line_px = fm.lineSpacing()       
+        # Kept for later size updates, so the metrics aren't queried again
+        self._line_px = line_px
+        self._descent = fm.descent()
         
         # ---- main horizontal layout (labels + comment box) ----
         main = QHBoxLayout(self)
@@ -86,13 +97,14 @@ class WidgetTextBar(QWidget):
             colour       = self._assign_color_by_suffix(key)
             self.key_colors[key] = colour
 
-            html = (
+            prefix = (
                 f"<b>"
                 f"<span style='font-size:{self.my_font_size}pt; color:{colour};'>{key}:</span>"
-                f"</b> 0.000000"
+                f"</b> "
             )
+            self._prefix[key] = prefix
 
-            lbl = QLabel(html)
+            lbl = QLabel(prefix + "0.000000")
             lbl.setAlignment(Qt.AlignLeft)
             lbl.setStyleSheet(f"font-size:{self.my_font_size}pt;")      # makes numbers match
             lbl.setFixedHeight(line_px)
@@ -108,7 +120,7 @@ class WidgetTextBar(QWidget):
         # enforce same font size in placeholder
         self._comment_edit.setStyleSheet(f"font-size:{self.my_font_size}pt;")
         # height = line + descent to avoid clipping
-        self._comment_edit.setFixedHeight(line_px + fm.descent())
+        self._comment_edit.setFixedHeight(line_px + self._descent)
         self._comment_edit.textChanged.connect(self._on_text_changed)
 
         # ---- assemble ----
@@ -116,21 +128,31 @@ class WidgetTextBar(QWidget):
         main.addWidget(self._comment_edit)
 
         # overall widget height also tracks font size
-        self.setFixedHeight(line_px + fm.descent())
+        self.setFixedHeight(line_px + self._descent)
 
     # --------------------------
     # Runtime updates
     # --------------------------
     def _update_text(self, dictionary):
-        font_pt = self.my_font_size
+        # A hidden bar only keeps the latest values, shown by showEvent
+        if not self.isVisible():
+            self._pending.update(dictionary)
+            return
+        # Only the value part of the HTML changes, the prefix is prebuilt.
+        # Labels already showing their value are left alone (no relayout)
+        prefix = self._prefix
+        last_val = self._last_val
         for key, val in dictionary.items():
             lbl = self.value_labels.get(key)
-            if lbl:
-                colour = self.key_colors[key]
-                lbl.setText(
-                    f"<b><span style='font-size:{font_pt}pt; color:{colour};'>{key}:</span></b> "
-                    f"{val:.3g}"
-                )
+            if lbl and last_val.get(key) != val:
+                last_val[key] = val
+                lbl.setText(prefix[key] + format(val, ".3g"))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            self._update_text(pending)
 
     def _on_text_changed(self):
         self._user_comment = self._comment_edit.text()
@@ -7,8 +7,8 @@ Version 5.2.5
 """
 
 import os
+import platform
 import sys
-from datetime import datetime
 
 import numpy as np
 
@@ -32,19 +32,37 @@ from AuxiliaryClasses.WidgetOutputFile import WidgetOutputFile
 from AuxiliaryClasses.WidgetSliders import WidgetSliders
 from AuxiliaryClasses.WidgetTextBar import WidgetTextBar
 
-
 class MainWidget(QWidget):
+    # Adjustments of values recovered from the output file: key -> function
+    # giving (stored value, F9 negative-Rinf state, or None to leave it)
+    _POSTLOAD_TRANSFORMS = {
+        'Rinf': lambda v: (abs(v), v < 0),
+        'Pei': lambda v: ((v + 1.0) % 4.0 - 1.0, None),
+    }
+    # datetime class, imported on the first Print (F4) rather than at startup
+    _datetime_cls = None
+
     def __init__(self, config_file: str):
         super().__init__()
 
         # Data attributes
-        self.file_data = {"freq": None, "Z_real": None, "Z_imag": None}
+        # File data as one (3, N) float64 block: rows freq, Z_real, Z_imag.
+        # Sliced at once by the frequency range; see also file_data
+        self._fd = None
+        # (data block, range) last given to the calculator, range None for all
+        self._expdata_range = None
+        # Dict handed to the calculator for a frequency range, refilled with
+        # new views on each range change instead of built anew
+        self._freq_slice_buf = {"freq": None, "Z_real": None, "Z_imag": None}
         self.v_sliders = None
+        # Checked state of the F9 (negative Rinf) button, kept by its toggled slot
+        self._rinf_negative = False
 
         # Initialization
         self._initialize_core_widgets()
         self._optimize_sliders_signaling()
         self.v_sliders = self.widget_sliders.get_all_values()
+        self.calculator.set_live_sliders(self.v_sliders)
 
         # Layout UI
         self._build_ui()
@@ -54,6 +72,14 @@ class MainWidget(QWidget):
         self._initialize_hotkeys_and_buttons()
         self._session_initialization()
 
+    @property
+    def file_data(self) -> dict:
+        """The file data as a dict of row views of _fd, as the calculator takes it."""
+        if self._fd is None:
+            return {"freq": None, "Z_real": None, "Z_imag": None}
+        freq, z_real, z_imag = self._fd
+        return {"freq": freq, "Z_real": z_real, "Z_imag": z_imag}
+
     #-----------------------UI and Widgets -----------------------------
     def _build_ui(self):
         """Assembles the main layout from smaller UI components."""
@@ -155,6 +181,9 @@ class MainWidget(QWidget):
     def _initialize_core_widgets(self):
         """Initializes configuration, core widgets, and models."""
         self.config = ConfigImporter(config_file)
+        # Shared by the labels and buttons built here (QFont is implicitly
+        # shared, so one instance serves them all)
+        self._small_qfont = QFont("Arial", self.config.small_font)
 
         self.widget_input_file = WidgetInputFile(self.config.input_file, 
                                                  self.config.input_file_type, 
@@ -166,7 +195,8 @@ class MainWidget(QWidget):
                                                    )
         self.toggle_model_button_wrapping = self._create_button_toggle_model()
         
-        self.widget_graphs = WidgetGraphs(print_mode = self.config.print_mode_boolean)
+        self.widget_graphs = WidgetGraphs(print_mode = self.config.print_mode_boolean,
+                                          use_opengl = self.config.use_opengl)
         self.freq_slider_wrapping = self._create_slider_and_wrapping()
         
         self.widget_sliders = WidgetSliders(
@@ -179,12 +209,19 @@ class MainWidget(QWidget):
                                               )
         self.calculator = Calculator()
         self.calculator.set_bounds(self.config.slider_configurations)
+
+        # The slider keys are fixed by the configuration
+        self._slider_keyset = frozenset(self.config.slider_configurations)
+        self._postload_transforms = tuple(
+            (key, transform) for key, transform in self._POSTLOAD_TRANSFORMS.items()
+            if key in self._slider_keyset
+        )
     
     # minor widget 1
     def _create_button_toggle_model(self):
         """Creates the Circuit Model toggle, sized and wrapped like the other buttons."""
         # Shared font
-        font = QFont("Arial", self.config.small_font)
+        font = self._small_qfont
         fm = QFontMetrics(font)
     
         # Label
@@ -250,13 +287,15 @@ class MainWidget(QWidget):
     
         # 2) 3 labels: a unit title, low‐value, high‐value
         title     = QLabel("Hz")
-        self.low_freq_label   = QLabel(f"{self.freq_slider.high_value():.2e}")
-        self.high_freq_label  = QLabel(f"{self.freq_slider.low_value():.2e}")
+        self._last_low_text  = f"{self.freq_slider.high_value():.2e}"
+        self._last_high_text = f"{self.freq_slider.low_value():.2e}"
+        self.low_freq_label   = QLabel(self._last_low_text)
+        self.high_freq_label  = QLabel(self._last_high_text)
     
         # 3) fonts
-        title.setFont(    QFont("Arial", self.config.small_font))
+        title.setFont(self._small_qfont)
         for lbl in (self.low_freq_label, self.high_freq_label):
-            lbl.setFont( QFont("Arial", self.config.small_font))
+            lbl.setFont(self._small_qfont)
             # white background + a little padding
             lbl.setStyleSheet("background: white; padding: 2px;")
     
@@ -285,10 +324,10 @@ class MainWidget(QWidget):
         self.widget_output_file.output_file_selected.connect(self.config.set_output_file)
 
         # Slider signals
-        self.widget_sliders.slider_value_updated.connect(self._handle_slider_update)
+        self.widget_sliders.sliders_batch_changed.connect(self._handle_sliders_batch)
         self.widget_sliders.all_sliders_values_reseted.connect(self._reset_v_sliders)
         self.widget_sliders.slider_was_disabled.connect(self.calculator.set_disabled_variables)
-        self.freq_slider.sliderMoved.connect(self._handle_frequency_update)
+        self.freq_slider.sliderMoved.connect(self._handle_frequency_moved)
         # Calculator signals
         self.calculator.model_manual_result.connect(self.widget_graphs.update_manual_plot)
         self.calculator.fit_builder.model_manual_values.connect(self.widget_sliders.set_all_variables)
@@ -296,66 +335,31 @@ class MainWidget(QWidget):
     def _initialize_hotkeys_and_buttons(self):
         """Initializes keyboard shortcuts and connects button actions."""
         
-        # All actions from buttons in WidgetButon
-        shortcut_f1 = QShortcut(QKeySequence(Qt.Key_F1), self)
-        shortcut_f1.activated.connect(self.widget_buttons.f1_button.click)
-        self.widget_buttons.f1_button.clicked.connect(
-            lambda: self.calculator.fit_model_cole(self.v_sliders)
-        )
-
-        shortcut_f2 = QShortcut(QKeySequence(Qt.Key_F2), self)
-        shortcut_f2.activated.connect(self.widget_buttons.f2_button.click)
-        self.widget_buttons.f2_button.clicked.connect(
-            lambda: self.calculator.fit_model_bode(self.v_sliders)
+        # All actions from buttons in WidgetButon: each function key clicks
+        # its button, and the button's clicked signal runs the action
+        buttons = self.widget_buttons
+        clicked_actions = (
+            (buttons.f1_button, Qt.Key_F1, self.calculator.fit_live_cole),
+            (buttons.f2_button, Qt.Key_F2, self.calculator.fit_live_bode),
+            (buttons.f3_button, Qt.Key_F3, self._handle_set_allfreqs),
+            (buttons.f4_button, Qt.Key_F4, self._print_model_parameters),
+            (buttons.f5_button, Qt.Key_F5, self.widget_input_file._show_previous_file),
+            (buttons.f6_button, Qt.Key_F6, self.widget_input_file._show_next_file),
+            (buttons.f7_button, Qt.Key_F7, self._handle_recover_file_values),
+            (buttons.f8_button, Qt.Key_F8, self._handle_set_default),
+            (buttons.f10_button, Qt.Key_F10, self._handle_toggle_pei),
+            (buttons.f11_button, Qt.Key_F11, self.calculator.set_gaussian_prior),
+            (buttons.f12_button, Qt.Key_F12, self.widget_output_file.print_variables_list),
+            (buttons.fdown_button, Qt.Key_PageDown, self.freq_slider.up_min),
+            (buttons.fup_button, Qt.Key_PageUp, self.freq_slider.down_max),
         )
+        for button, key, action in clicked_actions:
+            QShortcut(QKeySequence(key), self).activated.connect(button.click)
+            button.clicked.connect(action)
 
-        shortcut_f3 = QShortcut(QKeySequence(Qt.Key_F3), self)
-        shortcut_f3.activated.connect(self.widget_buttons.f3_button.click)
-        self.widget_buttons.f3_button.clicked.connect(self._handle_set_allfreqs)
-
-        shortcut_f4 = QShortcut(QKeySequence(Qt.Key_F4), self)
-        shortcut_f4.activated.connect(self.widget_buttons.f4_button.click)
-        self.widget_buttons.f4_button.clicked.connect(self._print_model_parameters)
-
-        shortcut_f5 = QShortcut(QKeySequence(Qt.Key_F5), self)
-        shortcut_f5.activated.connect(self.widget_buttons.f5_button.click)
-        self.widget_buttons.f5_button.clicked.connect(self.widget_input_file._show_previous_file)
-
-        shortcut_f6 = QShortcut(QKeySequence(Qt.Key_F6), self)
-        shortcut_f6.activated.connect(self.widget_buttons.f6_button.click)
-        self.widget_buttons.f6_button.clicked.connect(self.widget_input_file._show_next_file)
-
-        shortcut_f7 = QShortcut(QKeySequence(Qt.Key_F7), self)
-        shortcut_f7.activated.connect(self.widget_buttons.f7_button.click)
-        self.widget_buttons.f7_button.clicked.connect(self._handle_recover_file_values)
-
-        shortcut_f8 = QShortcut(QKeySequence(Qt.Key_F8), self)
-        shortcut_f8.activated.connect(self.widget_buttons.f8_button.click)
-        self.widget_buttons.f8_button.clicked.connect(self._handle_set_default)
-
-        shortcut_f9 = QShortcut(QKeySequence(Qt.Key_F9), self)
-        shortcut_f9.activated.connect(self.widget_buttons.f9_button.click)
-        self.widget_buttons.f9_button.toggled.connect(self._handle_rinf_negative)
-
-        shortcut_f10 = QShortcut(QKeySequence(Qt.Key_F10), self)
-        shortcut_f10.activated.connect(self.widget_buttons.f10_button.click)
-        self.widget_buttons.f10_button.clicked.connect(self._handle_toggle_pei)
-
-        shortcut_f11 = QShortcut(QKeySequence(Qt.Key_F11), self)
-        shortcut_f11.activated.connect(self.widget_buttons.f11_button.click)
-        self.widget_buttons.f11_button.clicked.connect(self.calculator.set_gaussian_prior)
-        
-        shortcut_f12 = QShortcut(QKeySequence(Qt.Key_F12), self)
-        shortcut_f12.activated.connect(self.widget_buttons.f12_button.click)
-        self.widget_buttons.f12_button.clicked.connect(self.widget_output_file.print_variables_list)
-
-        shortcut_page_down = QShortcut(QKeySequence(Qt.Key_PageDown), self)
-        shortcut_page_down.activated.connect(self.widget_buttons.fdown_button.click)
-        self.widget_buttons.fdown_button.clicked.connect(self.freq_slider.up_min)
-
-        shortcut_page_up = QShortcut(QKeySequence(Qt.Key_PageUp), self)
-        shortcut_page_up.activated.connect(self.widget_buttons.fup_button.click)
-        self.widget_buttons.fup_button.clicked.connect(self.freq_slider.down_max)
+        # F9 acts on the toggled state rather than on clicks
+        QShortcut(QKeySequence(Qt.Key_F9), self).activated.connect(buttons.f9_button.click)
+        buttons.f9_button.toggled.connect(self._handle_rinf_negative)
 
         shortcut_ctrl_z = QShortcut(QKeySequence(Qt.CTRL + Qt.Key_Z), self)
         shortcut_ctrl_z.activated.connect(self.calculator.fit_builder.recover_previous_fit)
@@ -376,15 +380,19 @@ class MainWidget(QWidget):
             print("MainWidget: Received empty or invalid data. Skipping update.")
             return
         
-        self.file_data.update(freq=freq, Z_real=Z_real, Z_imag=Z_imag)
-        self.widget_graphs.update_front_graphs(freq, Z_real, Z_imag)
-            
-        freqs_uniform, t, volt = self.calculator.transform_to_time_domain()
-        self.widget_graphs.update_timedomain_graph(freqs_uniform, t, volt)
-            
-        self.calculator.initialize_expdata(self.file_data)
-        self.freq_slider.set_list(freq)
-        self._update_sliders_data()
+        self._fd = np.stack((freq, Z_real, Z_imag)).astype(np.float64, copy=False)
+        freq, Z_real, Z_imag = self._fd
+
+        # All graph updates of the new file are painted together
+        with self.widget_graphs.batch_updates():
+            self.widget_graphs.update_front_graphs(freq, Z_real, Z_imag)
+                
+            freqs_uniform, t, volt = self.calculator.transform_to_time_domain()
+            self.widget_graphs.update_timedomain_graph(freqs_uniform, t, volt)
+                
+            self._initialize_expdata()
+            self.freq_slider.set_list(freq)
+            self._update_sliders_data(force=True)
             
         self.config.set_input_file_type(self.widget_input_file.get_file_type_name())
         self.config.set_input_file(self.widget_input_file.get_current_file_path())
@@ -402,32 +410,39 @@ class MainWidget(QWidget):
             self._handle_set_default()
             return 
 
-        for key in set(self.config.slider_configurations.keys()).intersection(dictionary.keys()):
+        for key in self._slider_keyset.intersection(dictionary):
             self.v_sliders[key] = float(dictionary[key])
             
-        if 'Rinf' in self.v_sliders:
-            if self.v_sliders['Rinf'] < 0:
-                self.v_sliders['Rinf']=abs(self.v_sliders['Rinf'])
-                self.widget_buttons.f9_button.setChecked(True)  # Toggle ON
-            else:
-                self.widget_buttons.f9_button.setChecked(False)  # Toggle OFF
-            
-        if 'Pei' in self.v_sliders:
-            self.v_sliders['Pei'] = (self.v_sliders['Pei']+1)%4. - 1.
+        # One pass over the adjusted keys; the F9 toggle is set once after
+        rinf_negative = None
+        for key, transform in self._postload_transforms:
+            self.v_sliders[key], flag = transform(self.v_sliders[key])
+            if flag is not None:
+                rinf_negative = flag
+        if rinf_negative is not None:
+            self.widget_buttons.f9_button.setChecked(rinf_negative)
             
+        # Sends no per-slider updates: one all_sliders_values_reseted reaches
+        # _reset_v_sliders, which reruns the model once
         self.widget_sliders.set_all_variables(self.v_sliders)
 
-    def _handle_slider_update(self, key, value):
+    def _handle_sliders_batch(self, values):
         """
-        Handles incoming slider updates by storing them and starting the debounce timer.
+        Handles a batch of incoming slider updates by storing them and starting the debounce timer.
         """
         arbitrary_time_delay=5 #reduce for more responsive sliders, icnrease for more optimization
         
-        self.pending_updates[key] = value
+        self.pending_updates.update(values)
         self.update_timer.start(arbitrary_time_delay)  
 
-    def _update_sliders_data(self):
-        """Processes all pending slider updates. Updates affected widgets and refreshes the UI."""
+    def _update_sliders_data(self, force=False):
+        """
+        Processes all pending slider updates. Updates affected widgets and refreshes the UI.
+        Without pending updates nothing changed, so the model is only rerun when
+        force is set (new data or a whole new set of values).
+        """
+        if not self.pending_updates and not force:
+            return
         
         for key, value in self.pending_updates.items():
             self.v_sliders[key] = value
@@ -446,28 +461,43 @@ class MainWidget(QWidget):
                 "Main._reset_v_sliders:Incoming dictionary keys do not match the slider keys in WidgetSliders."
             )
         self.v_sliders = dictionary
-        self._update_sliders_data()
+        self.calculator.set_live_sliders(self.v_sliders)
+        self._update_sliders_data(force=True)
+
+    def _handle_frequency_moved(self, bottom_i, top_i, f_max, f_min):
+        """
+        Stores the latest freq_slider range and starts its debounce timer, so
+        a drag refreshes the model and graphs once per burst of moves.
+        """
+        arbitrary_time_delay=15 #reduce for more responsive slider, increase for more optimization
+
+        self._pending_freq = (bottom_i, top_i, f_max, f_min)
+        self._freq_timer.start(arbitrary_time_delay)
+
+    def _apply_pending_frequency(self):
+        """Applies the last range stored by _handle_frequency_moved."""
+        if self._pending_freq is not None:
+            pending, self._pending_freq = self._pending_freq, None
+            self._handle_frequency_update(*pending)
 
     def _handle_frequency_update(self, bottom_i, top_i, f_max, f_min):
         """
         Handles frequency filtering based on freq_slider positions.
         """
         
-        freq_filtered = self.file_data['freq'][bottom_i: top_i + 1]
-        z_real_filtered = self.file_data["Z_real"][bottom_i: top_i + 1]
-        z_imag_filtered = self.file_data["Z_imag"][bottom_i: top_i + 1]
-
-        new_data = {
-            "freq": freq_filtered,
-            "Z_real": z_real_filtered,
-            "Z_imag": z_imag_filtered,
-        }
-        
-        self.low_freq_label .setText(f"{self.freq_slider.high_value():.2e}")
-        self.high_freq_label.setText(f"{self.freq_slider.low_value():.2e}")
-
-        self.calculator.initialize_expdata(new_data)
-        self.widget_graphs.apply_filter_frequency_range(f_min, f_max)
+        # Labels whose text doesn't change are left alone (no relayout)
+        low_text = f"{self.freq_slider.high_value():.2e}"
+        if low_text != self._last_low_text:
+            self.low_freq_label.setText(low_text)
+            self._last_low_text = low_text
+        high_text = f"{self.freq_slider.low_value():.2e}"
+        if high_text != self._last_high_text:
+            self.high_freq_label.setText(high_text)
+            self._last_high_text = high_text
+
+        self._initialize_expdata(bottom_i, top_i)
+        with self.widget_graphs.batch_updates():
+            self.widget_graphs.apply_filter_frequency_range(f_min, f_max)
 
     def _handle_set_allfreqs(self):
         """
@@ -476,14 +506,39 @@ class MainWidget(QWidget):
         and updates front graphs.
         """
         self.freq_slider.default()
-        self.calculator.initialize_expdata(self.file_data)
-        self.widget_graphs.update_front_graphs(
-            self.file_data['freq'],
-            self.file_data['Z_real'],
-            self.file_data['Z_imag']
-        )
-        # TODO: Update time-domain graph if needed.
-        self._update_sliders_data()
+        # Right after a load (or a previous F3) the model already has all the
+        # frequencies and the graphs show them: nothing to redo
+        if not self._initialize_expdata():
+            return
+        with self.widget_graphs.batch_updates():
+            self.widget_graphs.update_front_graphs(*self._fd)
+            # TODO: Update time-domain graph if needed.
+            self._update_sliders_data(force=True)
+
+    def _initialize_expdata(self, bottom_i=None, top_i=None):
+        """
+        Gives the calculator the file data in [bottom_i, top_i], or all of it
+        when no range is given. Returns False, doing nothing, when the
+        calculator already has that exact data.
+        """
+        data_range = None if bottom_i is None else (bottom_i, top_i)
+        if data_range == (0, self._fd.shape[1] - 1):
+            data_range = None  # the whole file, however it was asked for
+        last = self._expdata_range
+        if last is not None and last[0] is self._fd and last[1] == data_range:
+            return False
+        self._expdata_range = (self._fd, data_range)
+        if data_range is None:
+            self.calculator.initialize_expdata(self.file_data)
+            return True
+
+        # One slice of the stacked block; its rows are views, nothing is
+        # copied. The calculator keeps the dict, but it is only refilled
+        # right before being handed over again
+        data = self._freq_slice_buf
+        data["freq"], data["Z_real"], data["Z_imag"] = self._fd[:, bottom_i: top_i + 1]
+        self.calculator.initialize_expdata(data)
+        return True
 
     def _handle_set_default(self):
         """
@@ -495,6 +550,7 @@ class MainWidget(QWidget):
 
     def _handle_rinf_negative(self, state):
         """Handles toggling for Rinf being negative."""
+        self._rinf_negative = state
         self.calculator.set_rinf_negative(state)
         self.widget_sliders.get_slider('Rinf').toggle_orange_effect(state)
         self.calculator.run_model_manual(self.v_sliders)
@@ -510,7 +566,9 @@ class MainWidget(QWidget):
     # ------------------- OTHER METHODS ------------------- 
     def _session_initialization(self):
 
-        self.widget_input_file.force_emit_signal()
+        # The first file is loaded once the event loop runs, so the window
+        # is shown without waiting for it
+        QTimer.singleShot(0, self.widget_input_file.force_emit_signal)
         #Set default disabled sliders
         self.widget_sliders.set_default_disabled(self.config.slider_default_disabled)
         #self._update_sliders_data() #Needed anymore?
@@ -523,46 +581,72 @@ class MainWidget(QWidget):
         self.pending_updates = {}
         self.value_labels = {}
 
+        # Same for the frequency range slider
+        self._freq_timer = QTimer()
+        self._freq_timer.setSingleShot(True)
+        self._freq_timer.timeout.connect(self._apply_pending_frequency)
+        self._pending_freq = None
+
     def _print_model_parameters(self):
         """
         Called when Print is requested.
         Merges slider values, timestamp, and file information before writing output.
         """
-        date = {'date/time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        file = {'file': self.widget_input_file.get_current_file_name()}
+        # v_copy is already a copy, so everything is merged into it in place
         v_copy = self.v_sliders.copy()
         
         # If button-9 is toggled, modify values accordingly (e.g., change sign of 'Rinf')
-        if self.widget_buttons.f9_button.isChecked():
+        if self._rinf_negative:
             if 'Rinf' in v_copy:
                 v_copy['Rinf'] *= -1  # Negate Rinf if needed
 
-        main_dictionary = v_copy | date | file
-        model_dictionary = self.calculator.get_model_parameters()
-        graphs_dictionary = self.widget_graphs.get_graphs_parameters()
-        bottom_dictionary= self.widget_at_bottom.get_comment()
+        datetime_cls = MainWidget._datetime_cls
+        if datetime_cls is None:
+            from datetime import datetime as datetime_cls
+            MainWidget._datetime_cls = datetime_cls
 
-        self.widget_output_file.write_to_file(
-            main_dictionary | model_dictionary | graphs_dictionary | bottom_dictionary
-        )
+        v_copy['date/time'] = datetime_cls.now().strftime('%Y-%m-%d %H:%M:%S')
+        v_copy['file'] = self.widget_input_file.get_current_file_name()
+        v_copy.update(self.calculator.get_model_parameters())
+        v_copy.update(self.widget_graphs.get_graphs_parameters())
+        v_copy.update(self.widget_at_bottom.get_comment())
+
+        self.widget_output_file.write_to_file(v_copy)
+
+# Windows 8 and later support per-process DPI awareness. Read once; releases
+# like "2012ServerR2" are not plain numbers and are left alone
+_RELEASE = platform.release()
+_WINDOWS_DPI_AWARE = (platform.system() == 'Windows' and _RELEASE.isdigit()
+                      and int(_RELEASE) >= 8)
+
+
+def _set_dpi_awareness():
+    """Makes the process DPI aware, per monitor (v2) where Windows supports it."""
+    import ctypes
+    try:
+        # DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2, Windows 10 1703 and later
+        if ctypes.windll.user32.SetProcessDpiAwarenessContext(ctypes.c_void_p(-4)):
+            return
+    except (AttributeError, OSError):
+        pass
+    ctypes.windll.shcore.SetProcessDpiAwareness(True)
+
+
+# Folder resources are read from: PyInstaller's bundle folder when running
+# as a bundled app, else the working directory. Resolved once
+_BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
+
+def resource_path(relative_path):
+    """ Get absolute path to resource, works for dev and for PyInstaller """
+    return os.path.join(_BASE_PATH, relative_path)
 
 
 if __name__ == "__main__":
     
 #---Allowing proper display in different resolutions-----------------------
-    import platform
-    import ctypes
-    if platform.system()=='Windows' and int(platform.release()) >= 8:   
-        ctypes.windll.shcore.SetProcessDpiAwareness(True)
-        
-    def resource_path(relative_path):
-        """ Get absolute path to resource, works for dev and for PyInstaller """
-        try:
-            base_path = sys._MEIPASS  # PyInstaller sets this when running as a bundled app
-        except AttributeError:
-            base_path = os.path.abspath(".")
-        return os.path.join(base_path, relative_path)
-        
+    if _WINDOWS_DPI_AWARE:
+        _set_dpi_awareness()
         
 #---Allowing proper display in different resolutions-----------------------   
     